@@ -0,0 +1,211 @@
+"""Render many memes in parallel on a pool of worker processes."""
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+)
+from concurrent.futures.process import BrokenProcessPool
+from typing import (
+    Any, Deque, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+)
+
+logger = logging.getLogger(__name__)
+
+# Pools in a row that may break without rendering a meme before the
+# batch gives up; beyond that the workers cannot run at all.
+_MAX_BROKEN_POOLS = 3
+
+
+class MemeJob(NamedTuple):
+    """One meme to render in a batch."""
+
+    img_path: str
+    text: str
+    author: str
+    width: int = 500
+
+
+class MemeResult(NamedTuple):
+    """Outcome of one batch job.
+
+    Exactly one of ``path`` and ``error`` is set.  ``job`` is the input
+    exactly as given when it could not be turned into a ``MemeJob``.
+    """
+
+    index: int
+    job: MemeJob
+    path: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the job produced a meme."""
+        return self.error is None
+
+
+# ---------------------------------------------------------------------------
+# Worker-side state — one MemeEngine per process, so decoded source images
+# are shared between all the jobs that process handles.
+# ---------------------------------------------------------------------------
+_worker_engine = None
+
+
+def _init_worker(engine_kwargs: Dict) -> None:
+    """Create the per-process MemeEngine.
+
+    :param engine_kwargs: Keyword arguments for ``MemeEngine``.
+    """
+    global _worker_engine
+    from .MemeEngine import MemeEngine
+    _worker_engine = MemeEngine(**engine_kwargs)
+
+
+def _render_job(job: MemeJob) -> Tuple[Optional[str], Optional[str]]:
+    """Render a single job inside a worker process.
+
+    :param job: The job to render.
+    :return: ``(path, None)`` on success or ``(None, error)`` on failure.
+    """
+    try:
+        return _worker_engine.make_meme(*job), None
+    except Exception as exc:
+        return None, f"{type(exc).__name__}: {exc}"
+
+
+class BatchRenderer:
+    """Fan meme jobs out to worker processes and stream the results."""
+
+    def __init__(
+        self, engine_kwargs: Dict, workers: Optional[int] = None
+    ) -> None:
+        """Configure a batch renderer.
+
+        :param engine_kwargs: Keyword arguments used to build the
+            ``MemeEngine`` in every worker process.
+        :param workers: Number of worker processes (defaults to the
+            number of CPUs).
+        """
+        self.engine_kwargs = engine_kwargs
+        self.workers = workers or os.cpu_count() or 1
+
+    def run(self, jobs: Iterable) -> Iterator[MemeResult]:
+        """Render *jobs* and yield results in completion order.
+
+        Jobs are pulled from *jobs* lazily, keeping only a few per
+        worker in flight, so arbitrarily long iterables are fine.
+
+        Failures are reported per job: a malformed job and every job
+        in flight when a worker process dies (e.g. killed for running
+        out of memory) yield a result with ``error`` set, and the pool
+        is restarted for the jobs that follow.
+
+        :param jobs: ``MemeJob`` instances or
+            ``(img_path, text, author[, width])`` tuples.
+        :return: Iterator of ``MemeResult`` objects.
+        :raises BrokenProcessPool: If several fresh pools in a row
+            break before rendering any meme.
+        """
+        job_iter = enumerate(jobs)
+        queued: Deque[Tuple[int, MemeJob]] = deque()
+        broken_pools = 0
+        while True:
+            pending: Dict[Future, Tuple[int, MemeJob]] = {}
+            rendered = 0
+            try:
+                for result in self._run_pool(job_iter, queued, pending):
+                    rendered += result.ok
+                    yield result
+                return
+            except BrokenProcessPool:
+                for future in wait(pending).done:
+                    yield self._to_result(*pending[future], future)
+            broken_pools = 0 if rendered else broken_pools + 1
+            if broken_pools >= _MAX_BROKEN_POOLS:
+                raise BrokenProcessPool(
+                    f"{broken_pools} worker pools in a row broke "
+                    "before rendering a meme"
+                )
+            logger.warning("A batch worker process died; restarting pool")
+
+    def _run_pool(
+        self, job_iter: Iterator[Tuple[int, Any]],
+        queued: Deque[Tuple[int, MemeJob]],
+        pending: Dict[Future, Tuple[int, MemeJob]]
+    ) -> Iterator[MemeResult]:
+        """Run jobs on one process pool until they run out or it breaks.
+
+        :param job_iter: Remaining ``(index, job)`` input pairs.
+        :param queued: Valid jobs not yet submitted; a job whose
+            submission fails stays here for the next pool.
+        :param pending: Filled with the futures in flight, so the
+            caller can report them if the pool breaks.
+        :return: Iterator of ``MemeResult`` objects.
+        :raises BrokenProcessPool: If a worker process dies.
+        """
+        max_pending = self.workers * 4
+        exhausted = False
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.engine_kwargs,),
+        ) as pool:
+            while True:
+                while len(pending) < max_pending:
+                    if not queued:
+                        if exhausted:
+                            break
+                        try:
+                            index, item = next(job_iter)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        try:
+                            queued.append((index, MemeJob(*item)))
+                        except TypeError as exc:
+                            yield self._invalid(index, item, exc)
+                            continue
+                    future = pool.submit(_render_job, queued[0][1])
+                    pending[future] = queued.popleft()
+
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, job = pending.pop(future)
+                    yield self._to_result(index, job, future)
+
+    @staticmethod
+    def _invalid(index: int, item: Any, exc: Exception) -> MemeResult:
+        """Report an input that is not a valid job.
+
+        :param index: Position of the job in the input.
+        :param item: The input as given.
+        :param exc: Why it could not be turned into a ``MemeJob``.
+        :return: A failed MemeResult.
+        """
+        error = f"Invalid job {item!r}: {exc}"
+        logger.warning("Batch job %d failed: %s", index, error)
+        return MemeResult(index, item, None, error)
+
+    @staticmethod
+    def _to_result(index: int, job: MemeJob, future: Future) -> MemeResult:
+        """Convert a finished future into a MemeResult.
+
+        :param index: Position of the job in the input.
+        :param job: The job that was rendered.
+        :param future: The completed future.
+        :return: The job's MemeResult.
+        """
+        exc = future.exception()
+        if exc is not None:
+            error = f"{type(exc).__name__}: {exc}"
+            path = None
+        else:
+            path, error = future.result()
+
+        if error is not None:
+            logger.warning("Batch job %d failed: %s", index, error)
+        return MemeResult(index, job, path, error)
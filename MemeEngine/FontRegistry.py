@@ -0,0 +1,154 @@
+"""Registry of TrueType fonts with memoized FreeType faces."""
+
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from PIL import ImageFont
+
+from .exceptions import MemeGenerationError
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Font search paths per family — checked in order; first match wins.
+# Covers macOS system fonts, Homebrew, and common Linux locations.
+# ---------------------------------------------------------------------------
+_FONT_FAMILIES: Dict[str, List[str]] = {
+    'sans': [
+        '/System/Library/Fonts/Supplemental/Arial.ttf',
+        '/Library/Fonts/Arial Unicode.ttf',
+        '/Library/Fonts/Arial.ttf',
+        '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+        '/usr/share/fonts/TTF/DejaVuSans.ttf',
+    ],
+    'sans-bold': [
+        '/System/Library/Fonts/Supplemental/Arial Bold.ttf',
+        '/Library/Fonts/Arial Bold.ttf',
+        '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+        '/usr/share/fonts/TTF/DejaVuSans-Bold.ttf',
+    ],
+    'serif': [
+        '/System/Library/Fonts/Supplemental/Times New Roman.ttf',
+        '/Library/Fonts/Times New Roman.ttf',
+        '/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf',
+        '/usr/share/fonts/TTF/DejaVuSerif.ttf',
+    ],
+    'mono': [
+        '/System/Library/Fonts/Supplemental/Courier New.ttf',
+        '/Library/Fonts/Courier New.ttf',
+        '/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf',
+        '/usr/share/fonts/TTF/DejaVuSansMono.ttf',
+    ],
+}
+
+DEFAULT_FONT_FAMILY = 'sans'
+DEFAULT_FONT_SIZE = 24
+
+
+class FontRegistry:
+    """Resolve font families once and share loaded faces across threads.
+
+    Font files are located when the registry is created, so lookups in
+    the request path never touch the filesystem.  Each (path, size)
+    face is parsed at most once and then reused.
+    """
+
+    def __init__(
+        self, families: Optional[Dict[str, List[str]]] = None
+    ) -> None:
+        """Resolve the font file for every known family.
+
+        :param families: Mapping of family name to candidate font paths
+            (defaults to the built-in search paths).
+        """
+        families = _FONT_FAMILIES if families is None else families
+        self._paths: Dict[str, Optional[str]] = {
+            name: self._resolve(candidates)
+            for name, candidates in families.items()
+        }
+        self._faces: Dict[Tuple[Optional[str], int], ImageFont.ImageFont] = {}
+        self._lock = threading.Lock()
+
+        for name, path in self._paths.items():
+            logger.debug("Font family '%s' -> %s", name, path)
+
+    @property
+    def families(self) -> List[str]:
+        """Return the names of all registered font families."""
+        return list(self._paths)
+
+    def get(
+        self, family: str = DEFAULT_FONT_FAMILY,
+        size: int = DEFAULT_FONT_SIZE
+    ) -> ImageFont.ImageFont:
+        """Return the font for *family* at *size* points.
+
+        Falls back to Pillow's default font when no file was found for
+        the family.
+
+        :param family: Registered font family name.
+        :param size: Font size in points.
+        :return: A PIL font object.
+        :raises MemeGenerationError: If the family is unknown or the
+            size is not positive.
+        """
+        if family not in self._paths:
+            raise MemeGenerationError(
+                f"Unknown font family '{family}'; "
+                f"choose one of {sorted(self._paths)}"
+            )
+        if size <= 0:
+            raise MemeGenerationError(f"Invalid font size: {size}")
+
+        key = (self._paths[family], size)
+        face = self._faces.get(key)
+        if face is not None:
+            return face
+
+        with self._lock:
+            face = self._faces.get(key)
+            if face is None:
+                face = self._load(key[0], size)
+                self._faces[key] = face
+        return face
+
+    # -------------------------------------------------------------------
+    # Private helpers
+    # -------------------------------------------------------------------
+
+    @staticmethod
+    def _resolve(candidates: List[str]) -> Optional[str]:
+        """Return the first candidate path that is a usable font file.
+
+        :param candidates: Font file paths in order of preference.
+        :return: The first loadable path, or None.
+        """
+        for fp in candidates:
+            if os.path.isfile(fp):
+                try:
+                    ImageFont.truetype(fp, DEFAULT_FONT_SIZE)
+                except (IOError, OSError):
+                    continue
+                return fp
+        return None
+
+    @staticmethod
+    def _load(path: Optional[str], size: int) -> ImageFont.ImageFont:
+        """Load a TrueType face, falling back to the default font.
+
+        :param path: Resolved font file, or None.
+        :param size: Font size in points.
+        :return: A PIL font object.
+        """
+        if path is not None:
+            try:
+                return ImageFont.truetype(path, size)
+            except (IOError, OSError):
+                logger.warning("Cannot load font %s; using default", path)
+        else:
+            logger.warning(
+                "No TrueType font found; using default font"
+            )
+        return ImageFont.load_default(size)
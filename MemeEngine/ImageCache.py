@@ -0,0 +1,95 @@
+"""Bounded, thread-safe LRU cache of decoded PIL images."""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+class ImageCache:
+    """Keep recently used images in memory under a fixed byte budget.
+
+    Entries are evicted least-recently-used first whenever the total
+    decoded size of the cached images exceeds ``max_bytes``.  Cached
+    images are treated as read-only; callers that intend to draw on an
+    image must work on a copy.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Create an empty cache.
+
+        :param max_bytes: Upper bound on the decoded size of all cached
+            images.  A value of ``0`` disables caching.
+        """
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[Hashable, Image.Image]' = OrderedDict()
+        self._sizes = {}
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached images."""
+        return len(self._entries)
+
+    @property
+    def current_bytes(self) -> int:
+        """Return the decoded size of all cached images in bytes."""
+        return self._current_bytes
+
+    @staticmethod
+    def image_size(img: Image.Image) -> int:
+        """Estimate the in-memory size of a decoded image.
+
+        :param img: A loaded PIL Image.
+        :return: Approximate size of the pixel buffer in bytes.
+        """
+        return img.width * img.height * len(img.getbands())
+
+    def get(self, key: Hashable) -> Optional[Image.Image]:
+        """Return the cached image for *key*, or None on a miss.
+
+        :param key: Cache key.
+        :return: The cached (shared, read-only) image or None.
+        """
+        with self._lock:
+            img = self._entries.get(key)
+            if img is not None:
+                self._entries.move_to_end(key)
+            return img
+
+    def put(self, key: Hashable, img: Image.Image) -> None:
+        """Store *img* under *key*, evicting old entries as needed.
+
+        Images larger than the whole budget are not cached.
+
+        :param key: Cache key.
+        :param img: A loaded PIL Image.
+        """
+        size = self.image_size(img)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._current_bytes -= self._sizes.pop(key)
+                del self._entries[key]
+
+            self._entries[key] = img
+            self._sizes[key] = size
+            self._current_bytes += size
+
+            while self._current_bytes > self.max_bytes:
+                old_key, _ = self._entries.popitem(last=False)
+                self._current_bytes -= self._sizes.pop(old_key)
+                logger.debug("Evicted cached image %s", old_key)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._current_bytes = 0
@@ -0,0 +1,228 @@
+"""Download remote source images over pooled, cached HTTP connections."""
+
+import hashlib
+import json
+import logging
+from typing import BinaryIO, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .OutputStore import OutputStore
+from .exceptions import ImageFetchError, MemeGenerationError
+
+logger = logging.getLogger(__name__)
+
+# Default limit on the size of a single downloaded image.
+DEFAULT_MAX_DOWNLOAD_BYTES = 10 * 1024 * 1024
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class ImageFetcher:
+    """Fetch images by URL into memory, with an on-disk HTTP cache.
+
+    All requests share one ``requests.Session``, so connections to
+    popular hosts are kept alive and reused.  Bodies are streamed and
+    the download is aborted as soon as it exceeds ``max_bytes``.
+
+    Responses carrying an ``ETag`` or ``Last-Modified`` header are
+    cached by URL in an ``OutputStore``; later fetches of the same URL
+    send a conditional request and reuse the cached body on ``304 Not
+    Modified``.  If revalidation fails on a network error the cached
+    copy is used.
+
+    With a metrics hook, each fetch is timed as ``image_fetch_seconds``
+    and counted in ``image_fetch_total`` by outcome: ``downloaded``,
+    ``revalidated`` (304), ``stale`` (cached copy after a network
+    error) or ``error``.
+    """
+
+    def __init__(
+        self, cache_dir: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_DOWNLOAD_BYTES,
+        timeout: float = 15,
+        cache_max_bytes: Optional[int] = None,
+        cache_max_files: Optional[int] = None,
+        session: Optional[requests.Session] = None,
+        pool_size: int = 10,
+        metrics=None
+    ) -> None:
+        """Configure the fetcher.
+
+        :param cache_dir: Directory for cached downloads (None disables
+            caching).
+        :param max_bytes: Largest image accepted, in bytes.
+        :param timeout: Connect and read timeout in seconds.
+        :param cache_max_bytes: Size budget for the cache directory.
+        :param cache_max_files: File-count budget for the cache.
+        :param session: Session to use (one with a connection pool of
+            *pool_size* per host is created when omitted).
+        :param pool_size: Connections kept open per host.
+        :param metrics: Optional metrics hook (see ``metrics.py``).
+        """
+        self.max_bytes = max_bytes
+        self.metrics = metrics
+        self.timeout = timeout
+        self.cache = None
+        if cache_dir is not None:
+            self.cache = OutputStore(
+                cache_dir, cache_max_bytes, cache_max_files
+            )
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+
+    def fetch(self, url: str) -> bytes:
+        """Return the body of the image at *url*.
+
+        :param url: ``http`` or ``https`` URL.
+        :return: The encoded image bytes.
+        :raises ImageFetchError: If the URL is invalid, the request
+            fails, or the image is larger than ``max_bytes``.
+        """
+        if self.metrics is None:
+            return self._fetch(url)[0]
+
+        with self.metrics.timer('image_fetch_seconds'):
+            try:
+                data, outcome = self._fetch(url)
+            except ImageFetchError:
+                self.metrics.inc('image_fetch_total', result='error')
+                raise
+        self.metrics.inc('image_fetch_total', result=outcome)
+        return data
+
+    # -------------------------------------------------------------------
+    # Private helpers
+    # -------------------------------------------------------------------
+
+    def _fetch(self, url: str) -> Tuple[bytes, str]:
+        """Fetch *url*, revalidating or falling back to the cache.
+
+        :param url: ``http`` or ``https`` URL.
+        :return: ``(body, outcome)``; see the class docstring for the
+            outcome names.
+        :raises ImageFetchError: As for ``fetch``.
+        """
+        if urlsplit(url or '').scheme not in ('http', 'https'):
+            raise ImageFetchError(f"Not an http(s) URL: {url!r}")
+
+        name = hashlib.sha1(url.encode('utf-8')).hexdigest() + '.fetch'
+        cached = self._read_cached(name)
+
+        headers = {}
+        if cached is not None:
+            meta = cached[0]
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        try:
+            with self.session.get(
+                url, headers=headers, stream=True, timeout=self.timeout
+            ) as response:
+                if response.status_code == 304 and cached is not None:
+                    logger.debug("Revalidated cached image for %s", url)
+                    return cached[1], 'revalidated'
+                response.raise_for_status()
+                if response.status_code != 200:
+                    raise ImageFetchError(
+                        f"Unexpected HTTP {response.status_code} "
+                        f"for '{url}'"
+                    )
+                data = self._read_body(response, url)
+                meta = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'no_store': 'no-store' in response.headers.get(
+                        'Cache-Control', ''
+                    ),
+                }
+        except requests.RequestException as exc:
+            if cached is not None and not isinstance(
+                exc, requests.HTTPError
+            ):
+                logger.warning(
+                    "Using cached image for %s after error: %s", url, exc
+                )
+                return cached[1], 'stale'
+            raise ImageFetchError(
+                f"Failed to download image '{url}': {exc}"
+            ) from exc
+
+        logger.info("Downloaded %d bytes from %s", len(data), url)
+        if meta['etag'] or meta['last_modified']:
+            self._write_cached(name, meta, data)
+        return data, 'downloaded'
+
+    def _read_body(self, response: requests.Response, url: str) -> bytes:
+        """Stream a response body, enforcing ``max_bytes``.
+
+        :param response: A streaming response.
+        :param url: Requested URL (for error messages).
+        :return: The body.
+        :raises ImageFetchError: If the body is too large.
+        """
+        too_large = ImageFetchError(
+            f"Image at '{url}' is larger than {self.max_bytes} bytes"
+        )
+        length = response.headers.get('Content-Length', '')
+        if length.isdecimal() and int(length) > self.max_bytes:
+            raise too_large
+
+        data = bytearray()
+        for chunk in response.iter_content(_CHUNK_SIZE):
+            data += chunk
+            if len(data) > self.max_bytes:
+                raise too_large
+        return bytes(data)
+
+    def _read_cached(self, name: str) -> Optional[Tuple[Dict, bytes]]:
+        """Load a cached download.
+
+        :param name: Cache entry name.
+        :return: ``(metadata, body)`` or None if not cached.
+        """
+        if self.cache is None:
+            return None
+        path = self.cache.lookup(name)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline())
+                data = f.read()
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable cache entry %s: %s", path, exc)
+            return None
+        return meta, data
+
+    def _write_cached(self, name: str, meta: Dict, data: bytes) -> None:
+        """Store a download as a JSON metadata line followed by the body.
+
+        Failures are logged; the fetch itself still succeeds.
+
+        :param name: Cache entry name.
+        :param meta: Validators from the response.
+        :param data: Response body.
+        """
+        if self.cache is None or meta['no_store']:
+            return
+
+        def write(f: BinaryIO) -> None:
+            f.write(json.dumps(meta).encode('utf-8') + b'\n')
+            f.write(data)
+
+        try:
+            self.cache.put(name, write)
+        except MemeGenerationError as exc:
+            logger.warning("Could not cache image %s: %s", name, exc)
@@ -1,103 +1,466 @@
 """MemeEngine generates meme images with overlaid quotes."""
 
+import contextlib
+import hashlib
+import io
 import logging
 import os
 import random
 import string
+from typing import Iterable, Iterator, Optional, Tuple, Union
 
 from PIL import Image, ImageDraw, ImageFont
 
+from .BatchRenderer import BatchRenderer, MemeResult
+from .FontRegistry import DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE, FontRegistry
+from .ImageCache import ImageCache
+from .OutputEncoder import OutputEncoder
+from .OutputStore import OutputStore
 from .exceptions import MemeGenerationError
 
 logger = logging.getLogger(__name__)
 
-# ---------------------------------------------------------------------------
-# Font search paths — checked in order; first match wins.
-# Covers macOS system fonts, Homebrew, and common Linux locations.
-# ---------------------------------------------------------------------------
-_FONT_PATHS = [
-    '/System/Library/Fonts/Supplemental/Arial.ttf',
-    '/Library/Fonts/Arial Unicode.ttf',
-    '/Library/Fonts/Arial.ttf',
-    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
-    '/usr/share/fonts/TTF/DejaVuSans.ttf',
-]
+# Default decoded-size budget for the resized source image cache.
+DEFAULT_IMAGE_CACHE_BYTES = 64 * 1024 * 1024
+
+# Default budget for the cache of pre-rendered caption layers.
+DEFAULT_CAPTION_CACHE_BYTES = 16 * 1024 * 1024
+
+# Caption look: white text with a black outline of this width in pixels.
+_CAPTION_FILL = 'white'
+_CAPTION_STROKE_FILL = 'black'
+_CAPTION_STROKE_WIDTH = 1
+
+# A source image: a file path, or the encoded image itself.
+ImageSource = Union[str, bytes]
+
+# Downscale by whole factors with a box filter until within this factor of
+# the target, then finish with LANCZOS (see ``Image.resize``).
+_REDUCING_GAP = 3.0
+
+# Modes the RGBA caption layer can be pasted onto without being quantized.
+_PASTE_MODES = ('RGB', 'RGBA', 'L', 'LA')
+
+# Bump whenever rendering changes so content-addressed outputs are redone.
+_RENDER_VERSION = '4'
+
+# Stand-in for a stage timer when no metrics hook is configured.
+_NO_TIMER = contextlib.nullcontext()
 
 
 class MemeEngine:
     """Generate meme images by overlaying quotes on photographs."""
 
-    def __init__(self, output_dir: str) -> None:
+    def __init__(
+        self, output_dir: Optional[str],
+        cache_bytes: int = DEFAULT_IMAGE_CACHE_BYTES,
+        font_registry: Optional[FontRegistry] = None,
+        deterministic: bool = False,
+        encoder: Union[str, OutputEncoder] = 'png',
+        max_output_bytes: Optional[int] = None,
+        max_output_files: Optional[int] = None,
+        caption_cache_bytes: int = DEFAULT_CAPTION_CACHE_BYTES,
+        metrics=None
+    ) -> None:
         """Create a MemeEngine that saves output to *output_dir*.
 
-        :param output_dir: Directory to save generated memes.
+        :param output_dir: Directory to save generated memes, or None
+            for an engine that only renders in memory (``render``).
+        :param cache_bytes: Byte budget for the in-memory cache of
+            resized source images (``0`` disables caching).
+        :param font_registry: Shared font registry (a new one is
+            created when omitted).
+        :param deterministic: Default for ``make_meme``'s
+            *deterministic* flag.
+        :param encoder: Default output format, as an OutputEncoder or
+            a ``"format[:preset]"`` spec such as ``"jpeg:small"``.
+        :param max_output_bytes: Total size budget for *output_dir*;
+            least recently used memes are deleted beyond it.
+        :param max_output_files: File-count budget for *output_dir*.
+        :param caption_cache_bytes: Byte budget for the in-memory cache
+            of rendered caption layers (``0`` disables caching).
+        :param metrics: Optional metrics hook (see ``metrics.py``)
+            that receives per-stage timings as ``meme_stage_seconds``
+            and cache lookups as ``meme_cache_requests_total``.
+        :raises MemeGenerationError: If *encoder* is invalid.
         """
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
-        logger.info("MemeEngine output directory: %s", output_dir)
+        self.deterministic = deterministic
+        self.encoder = OutputEncoder.from_spec(encoder)
+        self.cache_bytes = cache_bytes
+        self.image_cache = ImageCache(cache_bytes)
+        self.caption_cache_bytes = caption_cache_bytes
+        self.caption_cache = ImageCache(caption_cache_bytes)
+        self.fonts = font_registry or FontRegistry()
+        self.metrics = metrics
+        self.store = None
+        if output_dir is not None:
+            self.store = OutputStore(
+                output_dir, max_output_bytes, max_output_files
+            )
+            logger.info("MemeEngine output directory: %s", output_dir)
 
     # -------------------------------------------------------------------
     # Public API
     # -------------------------------------------------------------------
 
     def make_meme(
-        self, img_path: str, text: str, author: str, width: int = 500
+        self, img_path: ImageSource, text: str, author: str,
+        width: int = 500,
+        font_family: str = DEFAULT_FONT_FAMILY,
+        font_size: int = DEFAULT_FONT_SIZE,
+        deterministic: Optional[bool] = None,
+        encoder: Union[str, OutputEncoder, None] = None
     ) -> str:
         """Generate a meme and return the path to the output file.
 
         Steps: load image -> resize -> add caption -> save.
 
-        :param img_path: Path to the source image.
+        In deterministic mode the caption position is derived from a
+        hash of the inputs and the output is named after that hash, so
+        a repeated request returns the existing file without rendering.
+
+        :param img_path: Path to the source image, or its encoded
+            bytes (decoded from memory, e.g. a downloaded image).
         :param text: Quote body text.
         :param author: Quote author.
         :param width: Maximum width in pixels (default 500).
+        :param font_family: Registered font family for the caption.
+        :param font_size: Caption font size in points.
+        :param deterministic: Override the engine's deterministic
+            setting for this call.
+        :param encoder: Override the engine's output format for this
+            call (OutputEncoder or ``"format[:preset]"`` spec).
         :return: Path to the saved meme image.
-        :raises MemeGenerationError: If the image cannot be loaded or saved.
+        :raises MemeGenerationError: If the image cannot be loaded or
+            saved, the font or format selection is invalid, or the
+            engine has no output directory.
         """
-        logger.info("Generating meme from %s", img_path)
-
-        # Step 1 — Load image from disk
-        img = self._load_image(img_path)
-
-        # Step 2 — Resize to max width while maintaining aspect ratio
-        img = self._resize_image(img, width)
+        if self.store is None:
+            raise MemeGenerationError(
+                "make_meme needs an output directory; use render() instead"
+            )
+        logger.info("Generating meme from %s", self._describe(img_path))
+        encoder = self._encoder(encoder)
+        font = self.fonts.get(font_family, font_size)
+        source_key = self._source_key(img_path)
+        digest = self._digest_if(
+            deterministic, source_key, text, author, width, font_family,
+            font_size, encoder
+        )
 
-        # Step 3 — Draw the caption at a random location
-        self._add_caption(img, text, author)
+        out_name = None
+        if digest is not None:
+            out_name = digest + encoder.extension
+            out_path = self.store.lookup(out_name)
+            self._count('output', out_path is not None)
+            if out_path is not None:
+                logger.info("Meme already rendered at %s", out_path)
+                return out_path
+
+        # Steps 1-3 — Load, resize and caption
+        img = self._render_image(
+            img_path, source_key, text, author, width, font, digest
+        )
 
-        # Step 4 — Save to a randomly named output file
-        out_path = self._save_image(img)
+        # Step 4 — Save to a randomly or content-addressed output file
+        out_path = self._save_image(img, encoder, out_name)
 
         logger.info("Meme saved to %s", out_path)
         return out_path
 
+    def render(
+        self, img_path: ImageSource, text: str, author: str,
+        width: int = 500,
+        font_family: str = DEFAULT_FONT_FAMILY,
+        font_size: int = DEFAULT_FONT_SIZE,
+        deterministic: Optional[bool] = None,
+        encoder: Union[str, OutputEncoder, None] = None
+    ) -> bytes:
+        """Generate a meme and return the encoded image without saving it.
+
+        Takes the same arguments as ``make_meme``; in deterministic mode
+        the result is byte-identical to the file ``make_meme`` writes.
+
+        :return: The encoded image (see ``encoder.mimetype``).
+        :raises MemeGenerationError: If the image cannot be loaded or
+            encoded, or the font or format selection is invalid.
+        """
+        logger.info("Rendering meme from %s", self._describe(img_path))
+        encoder = self._encoder(encoder)
+        font = self.fonts.get(font_family, font_size)
+        source_key = self._source_key(img_path)
+        digest = self._digest_if(
+            deterministic, source_key, text, author, width, font_family,
+            font_size, encoder
+        )
+
+        img = self._render_image(
+            img_path, source_key, text, author, width, font, digest
+        )
+
+        buf = io.BytesIO()
+        with self._timer('encode'):
+            encoder.encode(img, buf)
+        return buf.getvalue()
+
+    def render_id(
+        self, img_path: ImageSource, text: str, author: str,
+        width: int = 500,
+        font_family: str = DEFAULT_FONT_FAMILY,
+        font_size: int = DEFAULT_FONT_SIZE,
+        encoder: Union[str, OutputEncoder, None] = None
+    ) -> str:
+        """Return the digest identifying a deterministic render.
+
+        This is the name ``make_meme`` gives the output (without the
+        extension) in deterministic mode, and it changes whenever the
+        output would, so it can serve as a strong HTTP ETag.  It costs
+        a ``stat`` of the source; nothing is loaded or rendered.
+
+        Takes the same arguments as ``make_meme``.
+
+        :return: A hex digest.
+        :raises MemeGenerationError: If the source image is missing or
+            the format selection is invalid.
+        """
+        return self._render_digest(
+            self._source_key(img_path), text, author, width, font_family,
+            font_size, self._encoder(encoder)
+        )
+
+    def make_memes(
+        self, jobs: Iterable, workers: Optional[int] = None
+    ) -> Iterator[MemeResult]:
+        """Render many memes in parallel on a process pool.
+
+        Each worker process keeps its own MemeEngine configured like
+        this one, so decoded source images are reused across the jobs
+        it handles.  Results are yielded as soon as they finish; a
+        failing job yields a result with ``error`` set instead of
+        aborting the batch.  Workers do not evict; their outputs are
+        added to this engine's store, which enforces the budget.
+
+        :param jobs: Iterable of ``MemeJob`` or
+            ``(img_path, text, author[, width])`` tuples.
+        :param workers: Number of worker processes (defaults to the
+            number of CPUs).
+        :return: Iterator of ``MemeResult`` in completion order.
+        """
+        engine_kwargs = {
+            'output_dir': self.output_dir,
+            'cache_bytes': self.cache_bytes,
+            'caption_cache_bytes': self.caption_cache_bytes,
+            'deterministic': self.deterministic,
+            'encoder': self.encoder,
+        }
+        results = BatchRenderer(engine_kwargs, workers).run(jobs)
+        if self.store is None or not self.store.bounded:
+            return results
+        return self._tracked(results)
+
     # -------------------------------------------------------------------
     # Private helpers — each handles one discrete responsibility
     # -------------------------------------------------------------------
 
+    def _tracked(
+        self, results: Iterator[MemeResult]
+    ) -> Iterator[MemeResult]:
+        """Add each batch output to the store as it is yielded.
+
+        :param results: Results from ``BatchRenderer.run``.
+        :return: The same results.
+        """
+        for result in results:
+            if result.ok:
+                self.store.track(result.path)
+            yield result
+
+    @staticmethod
+    def _describe(img_path: ImageSource) -> str:
+        """Return a short description of a source for log messages.
+
+        :param img_path: Path or encoded image bytes.
+        :return: The path, or the size of in-memory data.
+        """
+        if isinstance(img_path, bytes):
+            return f'<{len(img_path)} bytes in memory>'
+        return img_path
+
     @staticmethod
-    def _load_image(img_path: str) -> Image.Image:
-        """Load an image from disk.
+    def _source_key(img_path: ImageSource) -> Tuple:
+        """Identify a source image by path, modification time and size.
+
+        In-memory images are identified by a hash of their content.
+
+        :param img_path: Path to the source image, or its bytes.
+        :return: ``(absolute path, mtime in ns, size in bytes)``, or
+            ``('<memory>', content hash, size in bytes)``.
+        :raises MemeGenerationError: If the file cannot be stat'ed.
+        """
+        if isinstance(img_path, bytes):
+            digest = hashlib.blake2b(img_path, digest_size=16).hexdigest()
+            return '<memory>', digest, len(img_path)
+        try:
+            st = os.stat(img_path)
+        except FileNotFoundError as exc:
+            raise MemeGenerationError(
+                f"Image not found: {img_path}"
+            ) from exc
+        except OSError as exc:
+            raise MemeGenerationError(
+                f"Cannot open image '{img_path}': {exc}"
+            ) from exc
+        return os.path.abspath(img_path), st.st_mtime_ns, st.st_size
 
-        :param img_path: Path to the image file.
+    @staticmethod
+    def _render_digest(source_key: Tuple, *params) -> str:
+        """Hash a source identity and render parameters.
+
+        :param source_key: Result of ``_source_key``.
+        :param params: Every other input that affects the output.
+        :return: A hex digest usable as a file name.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for part in (_RENDER_VERSION, *source_key, *params):
+            h.update(repr(part).encode('utf-8'))
+            h.update(b'\0')
+        return h.hexdigest()
+
+    def _encoder(
+        self, encoder: Union[str, OutputEncoder, None]
+    ) -> OutputEncoder:
+        """Resolve a per-call encoder, defaulting to the engine's.
+
+        :param encoder: OutputEncoder, spec string or None.
+        :return: An OutputEncoder.
+        :raises MemeGenerationError: If the spec is invalid.
+        """
+        if encoder is None:
+            return self.encoder
+        return OutputEncoder.from_spec(encoder)
+
+    def _digest_if(
+        self, deterministic: Optional[bool], source_key: Tuple, *params
+    ) -> Optional[str]:
+        """Return the render digest when rendering deterministically.
+
+        :param deterministic: Per-call flag (None uses the engine's).
+        :param source_key: Result of ``_source_key``.
+        :param params: Every other input that affects the output.
+        :return: Hex digest, or None in random mode.
+        """
+        if deterministic is None:
+            deterministic = self.deterministic
+        if not deterministic:
+            return None
+        return self._render_digest(source_key, *params)
+
+    def _render_image(
+        self, img_path: ImageSource, source_key: Tuple, text: str,
+        author: str,
+        width: int, font: ImageFont.ImageFont, digest: Optional[str]
+    ) -> Image.Image:
+        """Load, resize and caption a source image.
+
+        :param img_path: Path to the source image, or its bytes.
+        :param source_key: Result of ``_source_key`` for *img_path*.
+        :param text: Quote body text.
+        :param author: Quote author.
+        :param width: Maximum width in pixels.
+        :param font: Caption font.
+        :param digest: Seed for the caption placement (random if None).
+        :return: The captioned PIL Image.
+        :raises MemeGenerationError: If the image cannot be loaded.
+        """
+        rng = random.Random(digest) if digest is not None else None
+
+        # Steps 1 & 2 — Load and resize (served from cache when possible)
+        img = self._get_base_image(img_path, source_key, width)
+
+        # Step 3 — Draw the caption at a random (or seeded) location
+        with self._timer('caption'):
+            self._add_caption(img, text, author, font, rng)
+        return img
+
+    def _get_base_image(
+        self, img_path: ImageSource, source_key: Tuple, width: int
+    ) -> Image.Image:
+        """Return a private copy of the loaded and resized source image.
+
+        Resized images are cached by path, modification time, file size
+        and target width (or content hash for in-memory sources), so an
+        edited file is never served stale.
+
+        :param img_path: Path to the source image, or its bytes.
+        :param source_key: Result of ``_source_key`` for *img_path*.
+        :param width: Maximum width in pixels.
+        :return: A PIL Image that the caller may draw on.
+        :raises MemeGenerationError: If the image cannot be loaded.
+        """
+        key = (*source_key, width)
+        base = self.image_cache.get(key)
+        self._count('image', base is not None)
+        if base is None:
+            with self._timer('load'):
+                loaded = self._load_image(img_path, width)
+            with self._timer('resize'):
+                base = self._resize_image(loaded, width)
+            self.image_cache.put(key, base)
+        else:
+            logger.debug(
+                "Image cache hit for %s", self._describe(img_path)
+            )
+
+        return base.copy()
+
+    @staticmethod
+    def _load_image(
+        img_path: ImageSource, max_width: Optional[int] = None
+    ) -> Image.Image:
+        """Load an image from disk or memory.
+
+        When *max_width* is given, JPEGs are decoded with DCT scaling
+        straight to the smallest size of at least that width, skipping
+        most of the work of a full-resolution decode.
+
+        Images in other modes than RGB(A) or greyscale (e.g. palette
+        PNGs) are converted to RGB, or RGBA if they are transparent.
+
+        :param img_path: Path to the image file, or its bytes.
+        :param max_width: Width the image will be resized to.
         :return: A PIL Image object.
-        :raises MemeGenerationError: If the file cannot be opened.
+        :raises MemeGenerationError: If the image cannot be opened.
         """
+        name = MemeEngine._describe(img_path)
         try:
-            img = Image.open(img_path)
+            if isinstance(img_path, bytes):
+                img = Image.open(io.BytesIO(img_path))
+            else:
+                img = Image.open(img_path)
+            if max_width is not None and img.width > max_width:
+                img.draft(img.mode, (
+                    max_width, round(img.height * max_width / img.width)
+                ))
             # Force load so errors surface here, not later
             img.load()
+            if img.mode not in _PASTE_MODES:
+                # Palette, bilevel and CMYK images would map the caption
+                # onto their own colours when it is pasted
+                img = img.convert(
+                    'RGBA' if img.has_transparency_data else 'RGB'
+                )
         except FileNotFoundError as exc:
             raise MemeGenerationError(
                 f"Image not found: {img_path}"
             ) from exc
         except (OSError, ValueError) as exc:
             raise MemeGenerationError(
-                f"Cannot open image '{img_path}': {exc}"
+                f"Cannot open image '{name}': {exc}"
             ) from exc
 
         logger.debug(
-            "Loaded image %s (%dx%d)", img_path, img.width, img.height
+            "Loaded image %s (%dx%d)", name, img.width, img.height
         )
         return img
 
@@ -117,91 +480,121 @@ class MemeEngine:
 
         ratio = max_width / img.width
         new_height = int(img.height * ratio)
-        img = img.resize((max_width, new_height), Image.LANCZOS)
+        img = img.resize(
+            (max_width, new_height), Image.LANCZOS,
+            reducing_gap=_REDUCING_GAP
+        )
 
         logger.debug("Resized image to %dx%d", img.width, img.height)
         return img
 
-    @staticmethod
-    def _add_caption(img: Image.Image, text: str, author: str) -> None:
-        """Draw a quote caption at a random position on the image.
+    def _add_caption(
+        self, img: Image.Image, text: str, author: str,
+        font: ImageFont.ImageFont,
+        rng: Optional[random.Random] = None
+    ) -> None:
+        """Paste a quote caption at a random position on the image.
 
-        A thin shadow is rendered behind the white text to ensure
-        readability over both light and dark backgrounds.
+        The white text is outlined in black to stay readable over both
+        light and dark backgrounds.
 
         :param img: PIL Image to draw on (modified in place).
         :param text: Quote body.
         :param author: Quote author.
+        :param font: Font used to render the caption.
+        :param rng: Random generator for the placement (defaults to
+            the global ``random`` module).
         """
-        draw = ImageDraw.Draw(img)
-        caption = f'"{text}" - {author}'
-
-        # Load font for the caption text
-        font = MemeEngine._load_font(24)
+        randint = (rng or random).randint
+        layer, (left, top) = self._caption_layer(
+            f'"{text}" - {author}', font
+        )
 
         # --- Random caption placement ---
-        # Estimate text bounding box to keep caption within image
-        bbox = draw.textbbox((0, 0), caption, font=font)
-        text_w = bbox[2] - bbox[0]
-        text_h = bbox[3] - bbox[1]
-
         # Horizontal: allow the caption to start anywhere from 10px to
         # (image_width - text_width - 10), but always at least 10px in.
-        max_x = max(img.width - text_w - 10, 10)
-        x_pos = random.randint(10, max_x)
+        max_x = max(img.width - layer.width - 10, 10)
+        x_pos = randint(10, max_x)
 
         # Vertical: full range from 10px to (image_height - text_height - 10)
-        max_y = max(img.height - text_h - 10, 10)
-        y_pos = random.randint(10, max_y)
+        max_y = max(img.height - layer.height - 10, 10)
+        y_pos = randint(10, max_y)
 
         logger.debug("Caption position: (%d, %d)", x_pos, y_pos)
+        img.paste(layer, (x_pos + left, y_pos + top), layer)
 
-        # Shadow pass — offset by 2px in four directions for readability
-        for dx, dy in [(1, 1), (-1, -1), (1, -1), (-1, 1)]:
-            draw.text((x_pos + dx, y_pos + dy), caption,
-                      font=font, fill='black')
+    def _caption_layer(
+        self, caption: str, font: ImageFont.ImageFont
+    ) -> Tuple[Image.Image, Tuple[int, int]]:
+        """Return the caption rendered on a transparent RGBA layer.
 
-        # Main white text
-        draw.text((x_pos, y_pos), caption, font=font, fill='white')
+        The text and its outline are drawn in one stroked pass, cropped
+        to their bounding box, and kept in ``caption_cache`` so repeated
+        quotes are never measured or rasterized again.
 
-    def _save_image(self, img: Image.Image) -> str:
-        """Save the image to the output directory with a random filename.
+        :param caption: Full caption text.
+        :param font: Font to render it in.
+        :return: ``(layer, (left, top))`` where ``(left, top)`` is the
+            layer's offset from the text origin.
+        """
+        key = (caption, font, _CAPTION_STROKE_WIDTH)
+        layer = self.caption_cache.get(key)
+        self._count('caption', layer is not None)
+        if layer is not None:
+            return layer, layer.info['offset']
+
+        left, top, right, bottom = font.getbbox(
+            caption, stroke_width=_CAPTION_STROKE_WIDTH
+        )
+        layer = Image.new('RGBA', (right - left, bottom - top))
+        ImageDraw.Draw(layer).text(
+            (-left, -top), caption, font=font, fill=_CAPTION_FILL,
+            stroke_width=_CAPTION_STROKE_WIDTH,
+            stroke_fill=_CAPTION_STROKE_FILL
+        )
+        layer.info['offset'] = (left, top)
+        self.caption_cache.put(key, layer)
+        return layer, (left, top)
+
+    def _save_image(
+        self, img: Image.Image, encoder: OutputEncoder,
+        out_name: Optional[str] = None
+    ) -> str:
+        """Save the image to the output store.
 
         :param img: PIL Image to save.
+        :param encoder: Output format and encoder options.
+        :param out_name: Output file name (random when omitted).
         :return: Path to the saved file.
         :raises MemeGenerationError: If saving fails.
         """
-        out_name = ''.join(
-            random.choices(string.ascii_lowercase + string.digits, k=12)
-        ) + '.png'
-        out_path = os.path.join(self.output_dir, out_name)
-
-        try:
-            img.save(out_path)
-        except (OSError, ValueError) as exc:
-            raise MemeGenerationError(
-                f"Failed to save meme to '{out_path}': {exc}"
-            ) from exc
-
-        return out_path
-
-    # -------------------------------------------------------------------
-    # Font loading
-    # -------------------------------------------------------------------
+        if out_name is None:
+            out_name = ''.join(
+                random.choices(string.ascii_lowercase + string.digits, k=12)
+            ) + encoder.extension
+        with self._timer('save'):
+            return self.store.put(
+                out_name, lambda f: encoder.encode(img, f)
+            )
+
+    def _timer(self, stage: str):
+        """Return a context manager timing *stage* via the metrics hook.
+
+        :param stage: Stage name, used as the ``stage`` label.
+        :return: A timer, or a no-op context when metrics are disabled.
+        """
+        if self.metrics is None:
+            return _NO_TIMER
+        return self.metrics.timer('meme_stage_seconds', stage=stage)
 
-    @staticmethod
-    def _load_font(size: int) -> ImageFont.FreeTypeFont:
-        """Try to load a TrueType font, falling back to the default.
+    def _count(self, cache: str, hit: bool) -> None:
+        """Record a hit or miss of *cache* via the metrics hook.
 
-        :param size: Desired font size in points.
-        :return: A PIL ImageFont object.
+        :param cache: Cache name, used as the ``cache`` label.
+        :param hit: Whether the lookup was served from the cache.
         """
-        for fp in _FONT_PATHS:
-            if os.path.isfile(fp):
-                try:
-                    return ImageFont.truetype(fp, size)
-                except (IOError, OSError):
-                    continue
-
-        logger.warning("No TrueType font found; using default bitmap font")
-        return ImageFont.load_default()
+        if self.metrics is not None:
+            self.metrics.inc(
+                'meme_cache_requests_total', cache=cache,
+                result='hit' if hit else 'miss'
+            )
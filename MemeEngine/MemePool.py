@@ -0,0 +1,179 @@
+"""Keep a bounded buffer of pre-rendered random memes."""
+
+import logging
+import os
+import queue
+import threading
+from typing import Callable, Iterator, List, Optional
+
+from .BatchRenderer import MemeJob
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before retrying when there is nothing to render yet,
+# the buffer is full, or a render failed.
+_IDLE_WAIT = 0.5
+
+
+class MemePool:
+    """Render memes ahead of time so requests only pop a finished one.
+
+    Background producers call *pick* for the next job, render it with
+    the engine's ``make_meme`` and put the resulting path on a queue of
+    at most *size* entries.  Producers block while the queue is full,
+    so an idle server does no work beyond keeping the buffer topped up.
+
+    With ``processes=True`` the jobs are rendered by ``make_memes`` on
+    *workers* processes; otherwise *workers* threads share the engine.
+
+    Threads do not survive ``fork``, so call ``start`` in the process
+    that will serve requests; it is idempotent and restarts the
+    producers (with an empty buffer) after a fork.
+    """
+
+    def __init__(
+        self, engine, pick: Callable[[], Optional[MemeJob]],
+        size: int = 16, workers: int = 1, processes: bool = False,
+        metrics=None
+    ) -> None:
+        """Configure a pool; nothing is rendered until ``start``.
+
+        :param engine: The ``MemeEngine`` that renders the memes.  It
+            needs an output directory.
+        :param pick: Returns the next job, as a ``MemeJob`` or
+            ``(img_path, text, author[, width])`` tuple, or None when
+            there is nothing to render yet.
+        :param size: Maximum number of memes kept ready.
+        :param workers: Producer threads or processes.
+        :param processes: Render on worker processes instead of threads.
+        :param metrics: Optional metrics hook (see ``metrics.py``) that
+            counts ``get`` calls in ``meme_pool_requests_total`` as
+            ``hit`` or ``miss``.
+        """
+        self.engine = engine
+        self.pick = pick
+        self.size = size
+        self.workers = max(1, workers)
+        self.processes = processes
+        self.metrics = metrics
+        self._queue: queue.Queue = queue.Queue(size)
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of memes currently ready."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the producers in this process if not already running."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._queue = queue.Queue(self.size)
+            self._stop = threading.Event()
+            if self.processes:
+                targets = [self._produce_on_processes]
+            else:
+                targets = [self._produce_on_thread] * self.workers
+            self._threads = [
+                threading.Thread(
+                    target=target, name=f'meme-pool-{i}', daemon=True
+                )
+                for i, target in enumerate(targets)
+            ]
+            for thread in self._threads:
+                thread.start()
+        logger.info(
+            "Meme pool started: %d ready, %d %s", self.size, self.workers,
+            'processes' if self.processes else 'threads'
+        )
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the producers and wait for them to finish.
+
+        :param timeout: Seconds to wait for each producer.
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self._pid = None
+
+    def get(self) -> Optional[str]:
+        """Return the path of a ready meme without waiting.
+
+        Memes that the output store has evicted since they were
+        rendered are skipped.
+
+        :return: A path, or None if no meme is ready.
+        """
+        while True:
+            try:
+                path = self._queue.get_nowait()
+            except queue.Empty:
+                self._count('miss')
+                return None
+            stored = self.engine.store.lookup(os.path.basename(path))
+            if stored is not None:
+                self._count('hit')
+                return stored
+
+    # -------------------------------------------------------------------
+    # Private helpers
+    # -------------------------------------------------------------------
+
+    def _produce_on_thread(self) -> None:
+        """Render jobs one at a time in this thread until stopped."""
+        for job in self._jobs():
+            try:
+                path = self.engine.make_meme(*job)
+            except Exception:
+                logger.exception("Pre-rendering a meme failed")
+                self._stop.wait(_IDLE_WAIT)
+                continue
+            if not self._put(path):
+                return
+
+    def _produce_on_processes(self) -> None:
+        """Feed jobs to ``make_memes`` and queue its outputs."""
+        try:
+            for result in self.engine.make_memes(
+                self._jobs(), self.workers
+            ):
+                if result.ok and not self._put(result.path):
+                    return
+        except Exception:
+            logger.exception("Meme pool worker processes failed")
+
+    def _jobs(self) -> Iterator[MemeJob]:
+        """Yield jobs from ``pick`` until the pool is stopped."""
+        while not self._stop.is_set():
+            job = self.pick()
+            if job is None:
+                self._stop.wait(_IDLE_WAIT)
+            else:
+                yield MemeJob(*job)
+
+    def _put(self, path: str) -> bool:
+        """Queue *path*, waiting while the buffer is full.
+
+        :param path: Path of a rendered meme.
+        :return: False if the pool was stopped first.
+        """
+        while not self._stop.is_set():
+            try:
+                self._queue.put(path, timeout=_IDLE_WAIT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _count(self, result: str) -> None:
+        """Record a ``get`` outcome via the metrics hook, if any."""
+        if self.metrics is not None:
+            self.metrics.inc('meme_pool_requests_total', result=result)
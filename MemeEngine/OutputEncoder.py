@@ -0,0 +1,173 @@
+"""Output image formats, encoder settings and speed/size presets."""
+
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Tuple, Union
+
+from PIL import Image, features
+
+from .exceptions import MemeGenerationError
+
+# ---------------------------------------------------------------------------
+# Supported formats — Pillow format name, MIME type, file extension and the
+# Pillow feature that must be compiled in.
+# ---------------------------------------------------------------------------
+_FORMATS: Dict[str, Tuple[str, str, str]] = {
+    'PNG': ('image/png', '.png', 'zlib'),
+    'JPEG': ('image/jpeg', '.jpg', 'jpg'),
+    'WEBP': ('image/webp', '.webp', 'webp'),
+}
+
+_ALIASES: Dict[str, str] = {
+    'png': 'PNG',
+    'jpeg': 'JPEG',
+    'jpg': 'JPEG',
+    'webp': 'WEBP',
+}
+
+# ---------------------------------------------------------------------------
+# Encoder options per format and preset.  "fast" minimises encode time,
+# "small" minimises output size; "default" sits between the two.
+# ---------------------------------------------------------------------------
+_PRESETS: Dict[str, Dict[str, Dict[str, Any]]] = {
+    'PNG': {
+        'default': {'compress_level': 6},
+        'fast': {'compress_level': 1},
+        'small': {'compress_level': 9, 'optimize': True},
+    },
+    'JPEG': {
+        'default': {'quality': 85, 'subsampling': '4:2:0'},
+        'fast': {'quality': 80, 'subsampling': '4:2:0'},
+        'small': {
+            'quality': 75, 'subsampling': '4:2:0', 'optimize': True,
+            'progressive': True,
+        },
+    },
+    'WEBP': {
+        'default': {'quality': 80, 'method': 4},
+        'fast': {'quality': 80, 'method': 0},
+        'small': {'quality': 70, 'method': 6},
+    },
+}
+
+# Image modes each format can store without conversion.
+_MODES: Dict[str, Tuple[str, ...]] = {
+    'PNG': ('1', 'L', 'LA', 'P', 'RGB', 'RGBA', 'I', 'I;16'),
+    'JPEG': ('L', 'RGB', 'CMYK'),
+    'WEBP': ('RGB', 'RGBA'),
+}
+
+DEFAULT_PRESET = 'default'
+
+
+class OutputEncoder(NamedTuple):
+    """An output format together with its encoder options.
+
+    Encoders are immutable and compare by value, so they can be part
+    of the deterministic render hash and passed to worker processes.
+    """
+
+    format: str
+    options: Tuple[Tuple[str, Any], ...] = ()
+
+    @classmethod
+    def from_spec(
+        cls, spec: Union[str, 'OutputEncoder'], **overrides: Any
+    ) -> 'OutputEncoder':
+        """Build an encoder from a ``"format[:preset]"`` string.
+
+        Examples: ``"png"``, ``"jpeg:small"``, ``"webp:fast"``.
+
+        :param spec: Format and optional preset, or an OutputEncoder
+            (returned unchanged unless *overrides* are given).
+        :param overrides: Encoder options that replace the preset's,
+            e.g. ``quality=90``.
+        :return: An OutputEncoder.
+        :raises MemeGenerationError: If the format or preset is unknown
+            or the format is not supported by this Pillow build.
+        """
+        if isinstance(spec, OutputEncoder):
+            if not overrides:
+                return spec
+            options = {**dict(spec.options), **overrides}
+            return cls(spec.format, tuple(sorted(options.items())))
+
+        name, _, preset = spec.partition(':')
+        fmt = _ALIASES.get(name.strip().lower())
+        if fmt is None:
+            raise MemeGenerationError(
+                f"Unknown output format '{name}' "
+                f"(choose from {', '.join(sorted(_ALIASES))})"
+            )
+        preset = preset.strip().lower() or DEFAULT_PRESET
+        if preset not in _PRESETS[fmt]:
+            raise MemeGenerationError(
+                f"Unknown preset '{preset}' "
+                f"(choose from {', '.join(sorted(_PRESETS[fmt]))})"
+            )
+        if not features.check(_FORMATS[fmt][2]):
+            raise MemeGenerationError(
+                f"Output format '{name}' is not supported by this "
+                f"Pillow build"
+            )
+
+        options = {**_PRESETS[fmt][preset], **overrides}
+        return cls(fmt, tuple(sorted(options.items())))
+
+    @property
+    def mimetype(self) -> str:
+        """Return the MIME type of encoded images."""
+        return _FORMATS[self.format][0]
+
+    @property
+    def extension(self) -> str:
+        """Return the file extension (with leading dot)."""
+        return _FORMATS[self.format][1]
+
+    def encode(self, img: Image.Image, fp: BinaryIO) -> None:
+        """Encode *img* into the writable binary file object *fp*.
+
+        Images in a mode the format cannot store (e.g. RGBA as JPEG)
+        are converted first.
+
+        :param img: PIL Image to encode.
+        :param fp: Writable binary file object.
+        :raises MemeGenerationError: If encoding fails.
+        """
+        if img.mode not in _MODES[self.format]:
+            has_alpha = 'A' in img.getbands() or 'transparency' in img.info
+            if self.format == 'WEBP' and has_alpha:
+                img = img.convert('RGBA')
+            else:
+                img = img.convert('RGB')
+        try:
+            img.save(fp, format=self.format, **dict(self.options))
+        except (OSError, ValueError) as exc:
+            raise MemeGenerationError(
+                f"Failed to encode meme as {self.format}: {exc}"
+            ) from exc
+
+
+def supported_mimetypes() -> List[str]:
+    """Return the MIME types this Pillow build can encode.
+
+    :return: MIME types in the order PNG, JPEG, WebP.
+    """
+    return [
+        mimetype for mimetype, _, feature in _FORMATS.values()
+        if features.check(feature)
+    ]
+
+
+def encoder_for_mimetype(
+    mimetype: str, preset: str = DEFAULT_PRESET
+) -> OutputEncoder:
+    """Return the encoder for *mimetype* with the given preset.
+
+    :param mimetype: One of ``supported_mimetypes()``.
+    :param preset: ``"default"``, ``"fast"`` or ``"small"``.
+    :return: An OutputEncoder.
+    :raises MemeGenerationError: If *mimetype* is not supported.
+    """
+    for fmt, (known, _, _) in _FORMATS.items():
+        if known == mimetype:
+            return OutputEncoder.from_spec(f'{fmt}:{preset}')
+    raise MemeGenerationError(f"Unsupported output type '{mimetype}'")
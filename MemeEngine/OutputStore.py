@@ -0,0 +1,287 @@
+"""Sharded on-disk store for generated memes with LRU eviction."""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from typing import BinaryIO, Callable, List, Optional, Tuple
+
+from .exceptions import MemeGenerationError
+
+logger = logging.getLogger(__name__)
+
+# Every live store, so a forked child can reset their locks.
+_stores: 'weakref.WeakSet[OutputStore]' = weakref.WeakSet()
+
+
+def _reset_stores_after_fork() -> None:
+    """Give each store fresh locks in a forked child (see ``fork``)."""
+    for store in list(_stores):
+        store._reset_after_fork()
+
+
+class OutputStore:
+    """Keep generated files under a byte and file-count budget.
+
+    Files are spread over 256 subdirectories named after a hash of the
+    file name, so no single directory grows large.  The store keeps an
+    in-memory index of every file ordered by last access; writes and
+    lookups only update that index.  Whenever a budget is exceeded a
+    background thread deletes the least recently used files.
+
+    Files already on disk are indexed by a one-off background scan
+    (ordered by their access time), so the directory is never listed
+    in the request path.  Each process keeps its own index, so several
+    processes writing to one directory each enforce the budget only
+    for the files they know about.
+
+    Threads do not survive ``fork``: a forked child (e.g. a pre-fork
+    server worker) gets fresh locks and starts its own evictor on the
+    first write or lookup, re-scanning the directory.
+    """
+
+    def __init__(
+        self, root: str, max_bytes: Optional[int] = None,
+        max_files: Optional[int] = None
+    ) -> None:
+        """Open (and create) the store at *root*.
+
+        :param root: Output directory.
+        :param max_bytes: Upper bound on the total size of stored files
+            (None for no limit).
+        :param max_files: Upper bound on the number of stored files
+            (None for no limit).
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self._entries: 'OrderedDict[str, Tuple[str, int]]' = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._start_lock = threading.Lock()
+        self._evictor_pid: Optional[int] = None
+        os.makedirs(root, exist_ok=True)
+
+        _stores.add(self)
+        self._ensure_evictor()
+
+    @property
+    def bounded(self) -> bool:
+        """Return True if the store has a byte or file budget."""
+        return self.max_bytes is not None or self.max_files is not None
+
+    def __len__(self) -> int:
+        """Return the number of indexed files."""
+        return len(self._entries)
+
+    @property
+    def current_bytes(self) -> int:
+        """Return the total size of indexed files in bytes."""
+        return self._current_bytes
+
+    def path_for(self, name: str) -> str:
+        """Return the path at which the file *name* is stored.
+
+        :param name: File name (no directory part).
+        :return: Path inside the shard directory for *name*.
+        """
+        shard = hashlib.blake2b(name.encode('utf-8'), digest_size=1)
+        return os.path.join(self.root, shard.hexdigest(), name)
+
+    def lookup(self, name: str) -> Optional[str]:
+        """Return the path of a stored file and mark it as used.
+
+        :param name: File name.
+        :return: Its path, or None if it is not stored.
+        """
+        path = self.path_for(name)
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            return None
+        self._record(name, path, size)
+        return path
+
+    def put(self, name: str, write: Callable[[BinaryIO], None]) -> str:
+        """Store a new file written by *write*.
+
+        The file is written under a temporary name and renamed into
+        place, so concurrent readers never see a partial file.
+
+        :param name: File name.
+        :param write: Function that writes the content to a binary
+            file object.  It may raise ``MemeGenerationError``.
+        :return: Path of the stored file.
+        :raises MemeGenerationError: If writing fails.
+        """
+        path = self.path_for(name)
+        shard_dir = os.path.dirname(path)
+        tmp_path = None
+        try:
+            os.makedirs(shard_dir, exist_ok=True)
+            tmp_fd, tmp_path = tempfile.mkstemp(
+                dir=shard_dir, prefix='.', suffix=os.path.splitext(name)[1]
+            )
+            with os.fdopen(tmp_fd, 'wb') as f:
+                write(f)
+                size = f.tell()
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except (OSError, MemeGenerationError) as exc:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise MemeGenerationError(
+                f"Failed to save meme to '{path}': {exc}"
+            ) from exc
+
+        self._record(name, path, size)
+        return path
+
+    def track(self, path: str) -> None:
+        """Index a file written to the store by another process.
+
+        :param path: Path returned by that process's ``put``.
+        """
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            return
+        self._record(os.path.basename(path), path, size)
+
+    # -------------------------------------------------------------------
+    # Private helpers
+    # -------------------------------------------------------------------
+
+    def _record(self, name: str, path: str, size: int) -> None:
+        """Mark *name* as most recently used and wake the evictor.
+
+        :param name: File name.
+        :param path: Stored path.
+        :param size: File size in bytes.
+        """
+        if not self.bounded:
+            return
+        self._ensure_evictor()
+        with self._lock:
+            old = self._entries.pop(name, None)
+            if old is not None:
+                self._current_bytes -= old[1]
+            self._entries[name] = (path, size)
+            self._current_bytes += size
+            over = self._over_budget()
+        if over:
+            self._wakeup.set()
+
+    def _ensure_evictor(self) -> None:
+        """Start the evictor thread in this process if not running."""
+        if not self.bounded or self._evictor_pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._evictor_pid == os.getpid():
+                return
+            self._evictor_pid = os.getpid()
+            threading.Thread(
+                target=self._run, name='output-store-evictor', daemon=True
+            ).start()
+
+    def _reset_after_fork(self) -> None:
+        """Replace locks that another thread may have held at fork.
+
+        The index is kept, with its byte total recomputed in case the
+        fork interrupted an update; the new evictor re-scans the disk.
+        """
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._start_lock = threading.Lock()
+        self._evictor_pid = None
+        self._current_bytes = sum(
+            size for _, size in self._entries.values()
+        )
+
+    def _over_budget(self) -> bool:
+        """Return True if the indexed files exceed a budget.
+
+        Must be called with the lock held.
+        """
+        return (
+            (self.max_bytes is not None
+             and self._current_bytes > self.max_bytes)
+            or (self.max_files is not None
+                and len(self._entries) > self.max_files)
+        )
+
+    def _run(self) -> None:
+        """Index existing files, then evict whenever woken."""
+        try:
+            self._index_existing()
+        except Exception:
+            logger.exception("Failed to index %s", self.root)
+        while True:
+            try:
+                self._evict()
+            except Exception:
+                logger.exception("Eviction in %s failed", self.root)
+            self._wakeup.wait()
+            self._wakeup.clear()
+
+    def _index_existing(self) -> None:
+        """Add files already on disk to the index as least recently used.
+
+        Files recorded while the scan runs keep their newer position.
+        """
+        found: List[Tuple[float, str, str, int]] = []
+        for dirpath, dirs, files in os.walk(self.root):
+            for name in files:
+                if name.startswith('.'):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                found.append((st.st_atime, name, path, st.st_size))
+
+        # Newest first, each moved to the front: oldest ends up first
+        found.sort(reverse=True)
+        with self._lock:
+            for _, name, path, size in found:
+                if name in self._entries:
+                    continue
+                self._entries[name] = (path, size)
+                self._entries.move_to_end(name, last=False)
+                self._current_bytes += size
+        logger.info(
+            "Indexed %d existing files (%d bytes) in %s",
+            len(found), self._current_bytes, self.root
+        )
+
+    def _evict(self) -> None:
+        """Delete least recently used files until within budget."""
+        victims = []
+        with self._lock:
+            while self._entries and self._over_budget():
+                name, (path, size) = self._entries.popitem(last=False)
+                self._current_bytes -= size
+                victims.append((name, path))
+
+        for name, path in victims:
+            # Hold the lock per file so one re-saved meanwhile survives
+            with self._lock:
+                if name in self._entries:
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as exc:
+                    logger.warning("Could not evict %s: %s", path, exc)
+        if victims:
+            logger.debug("Evicted %d files from %s", len(victims), self.root)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_stores_after_fork)
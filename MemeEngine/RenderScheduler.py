@@ -0,0 +1,179 @@
+"""Run renders and downloads on a bounded pool with admission control."""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from .exceptions import RenderTimeoutError, SchedulerBusyError
+
+logger = logging.getLogger(__name__)
+
+
+class RenderScheduler:
+    """Bounded worker pool that sheds load instead of queueing it.
+
+    At most ``workers`` jobs run at once and at most ``max_queue`` more
+    wait for a worker.  Anything beyond that is rejected immediately
+    with ``SchedulerBusyError``, so under overload callers fail fast
+    instead of every request slowing down together.
+
+    Each job has a deadline (``timeout`` seconds after submission).  A
+    job still queued at its deadline is dropped without running, and
+    callers stop waiting once it passes.  A job that has already
+    started cannot be interrupted; it finishes in the background and
+    its result is discarded.
+
+    Workers are threads: Pillow releases the GIL while decoding,
+    resizing and encoding, and downloads wait on the network.
+
+    With a metrics hook, rejections and missed deadlines are counted
+    in ``scheduler_rejected_total`` and ``scheduler_timeouts_total``
+    with a ``scheduler`` label set to *name*.
+    """
+
+    def __init__(
+        self, workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        timeout: Optional[float] = None,
+        name: str = 'render',
+        metrics=None
+    ) -> None:
+        """Create the pool; worker threads start on demand.
+
+        :param workers: Jobs run concurrently (defaults to the number
+            of CPUs).
+        :param max_queue: Jobs allowed to wait for a worker (defaults
+            to four per worker).
+        :param timeout: Default deadline in seconds (None waits
+            indefinitely).
+        :param name: Name used for worker threads, logs and metrics.
+        :param metrics: Optional metrics hook (see ``metrics.py``).
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = (
+            self.workers * 4 if max_queue is None else max_queue
+        )
+        self.timeout = timeout
+        self.name = name
+        self.metrics = metrics
+        self._slots = threading.BoundedSemaphore(
+            self.workers + self.max_queue
+        )
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            self.workers, thread_name_prefix=name
+        )
+
+    def submit(
+        self, fn: Callable[..., Any], *args: Any,
+        timeout: Optional[float] = None, **kwargs: Any
+    ) -> concurrent.futures.Future:
+        """Queue ``fn(*args, **kwargs)`` without waiting for it.
+
+        :param fn: The job.
+        :param timeout: Deadline in seconds, overriding the default.
+        :return: A future for the job's result.
+        :raises SchedulerBusyError: If the queue is full.
+        """
+        if not self._slots.acquire(blocking=False):
+            self._count('scheduler_rejected_total')
+            raise SchedulerBusyError(
+                f"{self.name} queue is full ({self.max_queue} waiting)"
+            )
+
+        timeout = self.timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            future = self._pool.submit(
+                self._run, deadline, fn, args, kwargs
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def call(
+        self, fn: Callable[..., Any], *args: Any,
+        timeout: Optional[float] = None, **kwargs: Any
+    ) -> Any:
+        """Run ``fn(*args, **kwargs)`` on the pool and wait for it.
+
+        :param fn: The job.
+        :param timeout: Deadline in seconds, overriding the default.
+        :return: The job's return value.
+        :raises SchedulerBusyError: If the queue is full.
+        :raises RenderTimeoutError: If the deadline passes first.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        future = self.submit(fn, *args, timeout=timeout, **kwargs)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise self._timed_out(timeout) from None
+
+    async def call_async(
+        self, fn: Callable[..., Any], *args: Any,
+        timeout: Optional[float] = None, **kwargs: Any
+    ) -> Any:
+        """Coroutine version of ``call`` for asyncio (ASGI) servers.
+
+        The event loop is never blocked: the job runs on the pool and
+        this coroutine awaits its result.
+
+        :param fn: The job.
+        :param timeout: Deadline in seconds, overriding the default.
+        :return: The job's return value.
+        :raises SchedulerBusyError: If the queue is full.
+        :raises RenderTimeoutError: If the deadline passes first.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        future = self.submit(fn, *args, timeout=timeout, **kwargs)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout
+            )
+        except asyncio.TimeoutError:
+            raise self._timed_out(timeout) from None
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and drop the ones still queued.
+
+        :param wait: Wait for running jobs to finish.
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    # -------------------------------------------------------------------
+    # Private helpers
+    # -------------------------------------------------------------------
+
+    def _run(
+        self, deadline: Optional[float], fn: Callable[..., Any],
+        args: tuple, kwargs: dict
+    ) -> Any:
+        """Run a job on a worker unless its deadline has already passed.
+
+        :raises RenderTimeoutError: If the job expired in the queue.
+        """
+        if deadline is not None and time.monotonic() > deadline:
+            raise RenderTimeoutError(
+                f"{self.name} job expired before a worker was free"
+            )
+        return fn(*args, **kwargs)
+
+    def _timed_out(self, timeout: float) -> RenderTimeoutError:
+        """Count and build the error for a missed deadline."""
+        self._count('scheduler_timeouts_total')
+        logger.warning("%s job missed its %gs deadline", self.name, timeout)
+        return RenderTimeoutError(
+            f"{self.name} job did not finish within {timeout:g}s"
+        )
+
+    def _count(self, metric: str) -> None:
+        """Increment *metric* via the metrics hook, if any."""
+        if self.metrics is not None:
+            self.metrics.inc(metric, scheduler=self.name)
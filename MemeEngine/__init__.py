@@ -1,5 +1,15 @@
 """MemeEngine package — generate meme images with overlaid quotes."""
 
+from .BatchRenderer import MemeJob, MemeResult
+from .FontRegistry import FontRegistry
+from .ImageFetcher import ImageFetcher
 from .MemeEngine import MemeEngine
+from .MemePool import MemePool
+from .OutputEncoder import OutputEncoder
+from .OutputStore import OutputStore
+from .RenderScheduler import RenderScheduler
 
-__all__ = ['MemeEngine']
+__all__ = [
+    'FontRegistry', 'ImageFetcher', 'MemeEngine', 'MemeJob', 'MemePool',
+    'MemeResult', 'OutputEncoder', 'OutputStore', 'RenderScheduler',
+]
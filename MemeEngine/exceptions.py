@@ -5,3 +5,27 @@ class MemeGenerationError(Exception):
     """Raised when meme generation fails."""
 
     pass
+
+
+class ImageFetchError(MemeGenerationError):
+    """Raised when a remote source image cannot be downloaded."""
+
+    pass
+
+
+class SchedulerError(MemeGenerationError):
+    """Raised when a scheduled job cannot be run in time."""
+
+    pass
+
+
+class SchedulerBusyError(SchedulerError):
+    """Raised when a job is rejected because the queue is full."""
+
+    pass
+
+
+class RenderTimeoutError(SchedulerError):
+    """Raised when a job does not finish before its deadline."""
+
+    pass
@@ -1,9 +1,8 @@
 """Ingestor for CSV (.csv) quote files."""
 
+import csv
 import logging
-from typing import List
-
-import pandas as pd
+from typing import Iterator, List
 
 from .IngestorInterface import IngestorInterface
 from .QuoteModel import QuoteModel
@@ -11,18 +10,35 @@ from .exceptions import FileIngestError
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED_COLUMNS = ['body', 'author']
+
 
 class CSVIngestor(IngestorInterface):
-    """Parse quotes from a CSV file with 'body' and 'author' columns."""
+    """Parse quotes from a CSV file with 'body' and 'author' columns.
+
+    Two backends are available.  ``'pandas'`` (the default) reads only
+    the required columns as strings in chunks and converts them
+    column-wise; ``'csv'`` uses the standard library and avoids
+    importing pandas altogether.  If pandas is not installed the
+    ``'csv'`` backend is used automatically.
+    """
 
     allowed_extensions = ['csv']
 
+    # Parsing backend: 'pandas' or 'csv'.
+    backend = 'pandas'
+
+    # Rows read per pandas chunk; bounds memory for very large files.
+    chunksize = 50_000
+
     @classmethod
-    def parse(cls, path: str) -> List[QuoteModel]:
-        """Parse a .csv file and return QuoteModel objects.
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """Yield QuoteModel objects from a .csv file.
+
+        Rows whose body is blank are skipped.
 
         :param path: Path to the .csv file.
-        :return: List of QuoteModel instances.
+        :return: Iterator of QuoteModel instances.
         :raises FileIngestError: If the file cannot be read or is malformed.
         """
         if not cls.can_ingest(path):
@@ -30,10 +46,59 @@ class CSVIngestor(IngestorInterface):
 
         logger.info("Parsing CSV file: %s", path)
 
+        if cls.backend == 'pandas':
+            try:
+                import pandas  # noqa: F401
+            except ImportError:
+                logger.debug("pandas not installed; using csv module")
+            else:
+                return cls._iter_pandas(path)
+        return cls._iter_stdlib(path)
+
+    # ---------------------------------------------------------------
+    # Backends
+    # ---------------------------------------------------------------
+
+    @classmethod
+    def _iter_pandas(cls, path: str) -> Iterator[QuoteModel]:
+        """Yield quotes using chunked, column-wise pandas parsing.
+
+        :param path: Path to the .csv file.
+        :return: Iterator of QuoteModel instances.
+        :raises FileIngestError: If the file cannot be read or is malformed.
+        """
+        import pandas as pd
+
         try:
-            df = pd.read_csv(path)
+            header = pd.read_csv(path, nrows=0).columns
+            missing = cls._missing_columns(header)
+            if missing:
+                raise FileIngestError(
+                    f"CSV missing required columns {missing}: {path}"
+                )
+
+            reader = pd.read_csv(
+                path,
+                usecols=_REQUIRED_COLUMNS,
+                dtype=str,
+                keep_default_na=False,
+                chunksize=cls.chunksize,
+            )
+            with reader:
+                for df in reader:
+                    bodies = df['body'].str.strip()
+                    authors = df['author'].str.strip()
+                    keep = bodies != ''
+                    for body, author in zip(
+                        bodies[keep].tolist(), authors[keep].tolist()
+                    ):
+                        yield QuoteModel(body, author)
         except FileNotFoundError as exc:
             raise FileIngestError(f"File not found: {path}") from exc
+        except UnicodeDecodeError as exc:
+            raise FileIngestError(
+                f"Cannot decode file (not valid UTF-8): {path}"
+            ) from exc
         except pd.errors.EmptyDataError as exc:
             raise FileIngestError(f"CSV file is empty: {path}") from exc
         except pd.errors.ParserError as exc:
@@ -41,16 +106,52 @@ class CSVIngestor(IngestorInterface):
                 f"CSV file is malformed: {path}"
             ) from exc
 
-        required = {'body', 'author'}
-        if not required.issubset(df.columns):
-            missing = required - set(df.columns)
+    @classmethod
+    def _iter_stdlib(cls, path: str) -> Iterator[QuoteModel]:
+        """Yield quotes using the standard library ``csv`` module.
+
+        :param path: Path to the .csv file.
+        :return: Iterator of QuoteModel instances.
+        :raises FileIngestError: If the file cannot be read or is malformed.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if not header:
+                    raise FileIngestError(f"CSV file is empty: {path}")
+
+                missing = cls._missing_columns(header)
+                if missing:
+                    raise FileIngestError(
+                        f"CSV missing required columns {missing}: {path}"
+                    )
+
+                body_idx = header.index('body')
+                author_idx = header.index('author')
+                width = max(body_idx, author_idx) + 1
+                for row in reader:
+                    if len(row) < width:
+                        row = row + [''] * (width - len(row))
+                    body = row[body_idx].strip()
+                    if body:
+                        yield QuoteModel(body, row[author_idx])
+        except FileNotFoundError as exc:
+            raise FileIngestError(f"File not found: {path}") from exc
+        except UnicodeDecodeError as exc:
             raise FileIngestError(
-                f"CSV missing required columns {missing}: {path}"
-            )
+                f"Cannot decode file (not valid UTF-8): {path}"
+            ) from exc
+        except csv.Error as exc:
+            raise FileIngestError(
+                f"CSV file is malformed: {path}"
+            ) from exc
 
-        quotes = [
-            QuoteModel(str(row['body']), str(row['author']))
-            for _, row in df.iterrows()
-        ]
-        logger.info("Parsed %d quotes from %s", len(quotes), path)
-        return quotes
+    @staticmethod
+    def _missing_columns(header: List[str]) -> set:
+        """Return the required columns absent from *header*.
+
+        :param header: Column names found in the file.
+        :return: Set of missing column names.
+        """
+        return set(_REQUIRED_COLUMNS) - set(header)
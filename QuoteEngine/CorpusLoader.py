@@ -0,0 +1,199 @@
+"""Load quotes from many source files concurrently."""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import (
+    Executor, ProcessPoolExecutor, ThreadPoolExecutor
+)
+from typing import Dict, Iterable, List, Optional, Union
+
+from .Ingestor import Ingestor
+from .QuoteCache import QuoteCache
+from .QuoteCorpus import QuoteCorpus
+from .exceptions import QuoteEngineError
+
+logger = logging.getLogger(__name__)
+
+
+def _init_worker(cache: Optional[QuoteCache]) -> None:
+    """Share the parent's quote cache with a worker process.
+
+    Metrics are per process, so workers never record into a hook (the
+    cache's hook is already dropped when it is pickled).
+
+    :param cache: The parent's ``Ingestor.cache``.
+    """
+    Ingestor.cache = cache
+    Ingestor.metrics = None
+
+
+def _parse_source(path: str) -> QuoteCorpus:
+    """Parse one source file (runs in a worker thread or process).
+
+    Returning a packed corpus keeps the result cheap to send back from
+    a worker process.
+
+    :param path: Path to the quote file.
+    :return: QuoteCorpus of the file's quotes.
+    """
+    return QuoteCorpus(Ingestor.iter_parse(path))
+
+
+def _total_size(paths: Iterable[str]) -> int:
+    """Return the combined size of *paths*, ignoring missing files.
+
+    :param paths: File paths.
+    :return: Size in bytes.
+    """
+    total = 0
+    for path in paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    """Return a thread-safe multiprocessing context for workers.
+
+    :return: The ``forkserver`` context, or ``spawn`` without it.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    method = 'forkserver' if 'forkserver' in methods else 'spawn'
+    return multiprocessing.get_context(method)
+
+
+class CorpusLoader:
+    """Parse a set of quote files at the same time.
+
+    Formats whose ingestor is I/O- or subprocess-bound (``io_bound``)
+    are parsed on threads; CPU-bound formats are parsed on worker
+    processes when there is more than one of them.  Results are merged
+    in source order, so the corpus is the same however the work was
+    scheduled.  A file that fails to parse is logged and skipped.
+
+    Starting worker processes costs more than parsing a few small
+    files, so they are only used once the CPU-bound sources add up to
+    ``process_min_bytes``.  Workers are started with ``forkserver``
+    (``spawn`` where that is unavailable) rather than ``fork``, which
+    is unsafe in a process that already runs other threads.
+    """
+
+    # Combined size of CPU-bound sources at which processes are used.
+    process_min_bytes = 8 * 1024 * 1024
+
+    def __init__(
+        self, max_workers: Optional[int] = None, use_processes: bool = True
+    ) -> None:
+        """Configure the loader.
+
+        :param max_workers: Upper bound on concurrent parses per pool
+            (defaults to the number of CPUs).
+        :param use_processes: Allow CPU-bound formats to be parsed on
+            a process pool.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+
+    @staticmethod
+    def expand_sources(sources: Union[str, Iterable[str]]) -> List[str]:
+        """Turn a directory or list of paths into a list of files.
+
+        Directories are searched recursively for files that some
+        ingestor supports, in sorted order.
+
+        :param sources: A directory, a file, or an iterable of either.
+        :return: Ordered list of file paths.
+        """
+        if isinstance(sources, str):
+            sources = [sources]
+
+        paths = []
+        for source in sources:
+            if not os.path.isdir(source):
+                paths.append(source)
+                continue
+            found = []
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                found.extend(
+                    os.path.join(root, name)
+                    for name in sorted(files)
+                    if Ingestor.can_ingest(name)
+                )
+            paths.extend(found)
+        return paths
+
+    def load(self, sources: Union[str, Iterable[str]]) -> QuoteCorpus:
+        """Parse every source concurrently and merge the results.
+
+        :param sources: A directory, a file, or an iterable of either.
+        :return: QuoteCorpus of all quotes in source order.
+        """
+        quotes = QuoteCorpus()
+        for corpus in self.load_segments(sources).values():
+            quotes.extend(corpus)
+        return quotes
+
+    def load_segments(
+        self, sources: Union[str, Iterable[str]]
+    ) -> Dict[str, QuoteCorpus]:
+        """Parse every source concurrently, keeping files separate.
+
+        Files that fail to parse are logged and left out.
+
+        :param sources: A directory, a file, or an iterable of either.
+        :return: Ordered mapping of file path to its QuoteCorpus.
+        """
+        paths = self.expand_sources(sources)
+
+        ingestors = {}
+        for path in paths:
+            try:
+                ingestors[path] = Ingestor.ingestor_for(path)
+            except QuoteEngineError as exc:
+                logger.warning("Could not parse '%s': %s", path, exc)
+
+        cpu_bound = [p for p in ingestors if not ingestors[p].io_bound]
+        use_processes = (
+            self.use_processes and len(cpu_bound) > 1
+            and _total_size(cpu_bound) >= self.process_min_bytes
+        )
+
+        thread_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        process_pool = (
+            ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(cpu_bound)),
+                mp_context=_process_context(),
+                initializer=_init_worker,
+                initargs=(Ingestor.cache,),
+            )
+            if use_processes else None
+        )
+
+        try:
+            futures = []
+            for path in ingestors:
+                pool: Executor = thread_pool
+                if process_pool is not None and path in cpu_bound:
+                    pool = process_pool
+                futures.append((path, pool.submit(_parse_source, path)))
+
+            segments: Dict[str, QuoteCorpus] = {}
+            for path, future in futures:
+                try:
+                    segments[path] = future.result()
+                except QuoteEngineError as exc:
+                    logger.warning("Could not parse '%s': %s", path, exc)
+        finally:
+            thread_pool.shutdown()
+            if process_pool is not None:
+                process_pool.shutdown()
+
+        logger.info(
+            "Loaded %d quotes from %d files",
+            sum(len(c) for c in segments.values()), len(segments)
+        )
+        return segments
@@ -1,9 +1,11 @@
 """Ingestor for Word (.docx) quote files."""
 
 import logging
-from typing import List
+import posixpath
+import zipfile
+from typing import Iterator
 
-from docx import Document
+from lxml import etree
 
 from .IngestorInterface import IngestorInterface
 from .QuoteModel import QuoteModel
@@ -11,21 +13,57 @@ from .exceptions import FileIngestError
 
 logger = logging.getLogger(__name__)
 
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_BODY = _W + 'body'
+_PARAGRAPH = _W + 'p'
+_RUN = _W + 'r'
+_HYPERLINK = _W + 'hyperlink'
+_BREAK = _W + 'br'
+_BREAK_TYPE = _W + 'type'
+
+_PACKAGE_RELS = '_rels/.rels'
+_RELATIONSHIP = (
+    '{http://schemas.openxmlformats.org/package/2006/relationships}'
+    'Relationship'
+)
+_MAIN_DOCUMENT_TYPE = '/officeDocument'
+
+# Text of the run children that python-docx's ``Paragraph.text``
+# renders; None means the element's own text.  ``w:br`` is handled
+# separately: only text-wrapping breaks become a newline, page and
+# column breaks add nothing.
+_TEXT_ELEMENTS = {
+    _W + 't': None,
+    _W + 'tab': '\t',
+    _W + 'ptab': '\t',
+    _W + 'cr': '\n',
+    _W + 'noBreakHyphen': '-',
+}
+
 
 class DocxIngestor(IngestorInterface):
     """Parse quotes from a .docx file.
 
     Expected format: one quote per paragraph as  "body" - author
+
+    The main document part is located through the package
+    relationships and streamed with ``lxml.etree.iterparse``; each
+    top-level paragraph is discarded once parsed, so memory use does
+    not grow with the size of the document.  Paragraph text is the
+    same as python-docx's ``Paragraph.text``: runs and hyperlinks that
+    are direct children of the paragraph, so text boxes and alternate
+    content are not read twice.
     """
 
     allowed_extensions = ['docx']
+    parse_version = 2
 
     @classmethod
-    def parse(cls, path: str) -> List[QuoteModel]:
-        """Parse a .docx file and return QuoteModel objects.
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """Yield QuoteModel objects from a .docx file, paragraph by paragraph.
 
         :param path: Path to the .docx file.
-        :return: List of QuoteModel instances.
+        :return: Iterator of QuoteModel instances.
         :raises FileIngestError: If the file cannot be read.
         """
         if not cls.can_ingest(path):
@@ -34,19 +72,71 @@ class DocxIngestor(IngestorInterface):
         logger.info("Parsing DOCX file: %s", path)
 
         try:
-            doc = Document(path)
+            with zipfile.ZipFile(path) as archive, \
+                    archive.open(cls._main_part(archive)) as xml:
+                for _, elem in etree.iterparse(xml, events=('end',)):
+                    parent = elem.getparent()
+                    if parent is None or parent.tag != _BODY:
+                        continue
+
+                    if elem.tag == _PARAGRAPH:
+                        quote = cls._parse_quote_line(
+                            cls._paragraph_text(elem)
+                        )
+                        if quote is not None:
+                            yield quote
+
+                    # Drop finished body children to keep memory flat
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del parent[0]
         except FileNotFoundError as exc:
             raise FileIngestError(f"File not found: {path}") from exc
-        except Exception as exc:
+        except OSError as exc:
+            raise FileIngestError(
+                f"Cannot read DOCX file: {path} — {exc}"
+            ) from exc
+        except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError) as exc:
             raise FileIngestError(
                 f"Failed to open DOCX file: {path} — {exc}"
             ) from exc
 
-        quotes: List[QuoteModel] = []
-        for para in doc.paragraphs:
-            quote = cls._parse_quote_line(para.text)
-            if quote is not None:
-                quotes.append(quote)
+    @staticmethod
+    def _main_part(archive: zipfile.ZipFile) -> str:
+        """Return the archive name of the main document part.
+
+        :param archive: The open .docx package.
+        :return: Name of the part, e.g. ``word/document.xml``.
+        :raises KeyError: If the package has no main document.
+        """
+        rels = etree.fromstring(archive.read(_PACKAGE_RELS))
+        for rel in rels.iter(_RELATIONSHIP):
+            if rel.get('Type', '').endswith(_MAIN_DOCUMENT_TYPE):
+                return posixpath.normpath(rel.get('Target').lstrip('/'))
+        raise KeyError('no main document relationship')
+
+    @staticmethod
+    def _paragraph_text(paragraph: etree._Element) -> str:
+        """Return the plain text of a ``w:p`` element.
 
-        logger.info("Parsed %d quotes from %s", len(quotes), path)
-        return quotes
+        :param paragraph: A paragraph element.
+        :return: The paragraph's text.
+        """
+        parts = []
+        for child in paragraph.iterchildren(_RUN, _HYPERLINK):
+            runs = (
+                child.iterchildren(_RUN) if child.tag == _HYPERLINK
+                else (child,)
+            )
+            for run in runs:
+                for node in run.iterchildren():
+                    if node.tag == _BREAK:
+                        kind = node.get(_BREAK_TYPE, 'textWrapping')
+                        if kind == 'textWrapping':
+                            parts.append('\n')
+                    elif node.tag in _TEXT_ELEMENTS:
+                        text = _TEXT_ELEMENTS[node.tag]
+                        parts.append(
+                            node.text or ('' if text is None else text)
+                        )
+        return ''.join(parts)
@@ -1,12 +1,13 @@
 """Facade ingestor that delegates to the appropriate file-type ingestor."""
 
 import logging
-from typing import List
+from typing import Iterable, Iterator, Optional, Type
 
 from .CSVIngestor import CSVIngestor
 from .DocxIngestor import DocxIngestor
 from .IngestorInterface import IngestorInterface
 from .PDFIngestor import PDFIngestor
+from .QuoteCache import QuoteCache
 from .QuoteModel import QuoteModel
 from .TextIngestor import TextIngestor
 from .exceptions import UnsupportedFileTypeError
@@ -15,16 +16,73 @@ logger = logging.getLogger(__name__)
 
 
 class Ingestor(IngestorInterface):
-    """Select and delegate to the correct ingestor for a given file."""
+    """Select and delegate to the correct ingestor for a given file.
+
+    Set ``Ingestor.cache`` to a ``QuoteCache`` to serve unchanged
+    sources from the persistent parsed-quote cache.
+
+    Set ``Ingestor.metrics`` to a metrics hook (see ``metrics.py``) to
+    time each source as ``quote_ingest_seconds`` and count its quotes
+    in ``quotes_ingested_total``, both labelled by ingestor.  Parsing
+    is lazy, so the time runs until the returned iterator is exhausted.
+    """
 
     ingestors = [CSVIngestor, DocxIngestor, PDFIngestor, TextIngestor]
 
+    cache: Optional[QuoteCache] = None
+
+    metrics = None
+
+    @classmethod
+    def can_ingest(cls, path: str) -> bool:
+        """Check whether any registered ingestor can handle the file.
+
+        :param path: Path to the file.
+        :return: True if the file extension is supported.
+        """
+        return any(ingestor.can_ingest(path) for ingestor in cls.ingestors)
+
+    @classmethod
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """Lazily parse a file by delegating to the matching ingestor.
+
+        :param path: Path to the quote file.
+        :return: Iterator of QuoteModel instances.
+        :raises UnsupportedFileTypeError: If no ingestor supports the file.
+        """
+        ingestor = cls.ingestor_for(path)
+        if cls.cache is not None:
+            quotes = cls.cache.iter_parse(path, ingestor)
+        else:
+            quotes = ingestor.iter_parse(path)
+        if cls.metrics is None:
+            return quotes
+        return cls._measured(quotes, ingestor.__name__)
+
+    @classmethod
+    def _measured(
+        cls, quotes: Iterable[QuoteModel], name: str
+    ) -> Iterator[QuoteModel]:
+        """Pass *quotes* through, recording time and count.
+
+        :param quotes: Quotes from one source.
+        :param name: Ingestor name for the ``ingestor`` label.
+        :return: The same quotes.
+        """
+        metrics = cls.metrics
+        count = 0
+        with metrics.timer('quote_ingest_seconds', ingestor=name):
+            for quote in quotes:
+                count += 1
+                yield quote
+        metrics.inc('quotes_ingested_total', count, ingestor=name)
+
     @classmethod
-    def parse(cls, path: str) -> List[QuoteModel]:
-        """Parse a file by delegating to the matching ingestor.
+    def ingestor_for(cls, path: str) -> Type[IngestorInterface]:
+        """Return the ingestor class that handles *path*.
 
         :param path: Path to the quote file.
-        :return: List of QuoteModel instances.
+        :return: The matching ingestor class.
         :raises UnsupportedFileTypeError: If no ingestor supports the file.
         """
         for ingestor in cls.ingestors:
@@ -33,6 +91,6 @@ class Ingestor(IngestorInterface):
                     "Delegating '%s' to %s",
                     path, ingestor.__name__
                 )
-                return ingestor.parse(path)
+                return ingestor
 
         raise UnsupportedFileTypeError(path)
@@ -2,7 +2,7 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from .QuoteModel import QuoteModel
 
@@ -13,12 +13,22 @@ class IngestorInterface(ABC):
     """Abstract base class defining the ingestor interface.
 
     Subclasses must set ``allowed_extensions`` and implement
-    ``parse``.  Shared helpers such as ``_parse_quote_line``
-    live here so that child classes stay DRY.
+    ``iter_parse`` as a generator; ``parse`` collects its output into
+    a list.  Shared helpers such as ``_parse_quote_line`` live here so
+    that child classes stay DRY.
     """
 
     allowed_extensions: List[str] = []
 
+    # True when parsing mostly waits on I/O or a subprocess, so threads
+    # are enough to run several parses concurrently.
+    io_bound: bool = False
+
+    # Bump when a change to the parser alters the quotes it produces,
+    # so entries cached by ``QuoteCache`` under the old parser are
+    # re-parsed instead of served.
+    parse_version: int = 1
+
     @classmethod
     def can_ingest(cls, path: str) -> bool:
         """Check whether this ingestor can handle the given file.
@@ -30,13 +40,28 @@ class IngestorInterface(ABC):
         return ext in cls.allowed_extensions
 
     @classmethod
-    @abstractmethod
     def parse(cls, path: str) -> List[QuoteModel]:
         """Parse the file and return a list of QuoteModel objects.
 
         :param path: Path to the file to parse.
         :return: List of QuoteModel instances.
         """
+        quotes = list(cls.iter_parse(path))
+        logger.info("Parsed %d quotes from %s", len(quotes), path)
+        return quotes
+
+    @classmethod
+    @abstractmethod
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """Lazily yield QuoteModel objects parsed from the file.
+
+        Implementations read the file incrementally so memory use
+        stays bounded regardless of file size.  Errors surface when
+        the iterator is first advanced.
+
+        :param path: Path to the file to parse.
+        :return: Iterator of QuoteModel instances.
+        """
         ...
 
     # ---------------------------------------------------------------
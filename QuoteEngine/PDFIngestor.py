@@ -4,7 +4,11 @@ import logging
 import os
 import subprocess
 import tempfile
-from typing import List
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional
 
 from .IngestorInterface import IngestorInterface
 from .QuoteModel import QuoteModel
@@ -12,6 +16,72 @@ from .exceptions import FileIngestError
 
 logger = logging.getLogger(__name__)
 
+_INSTALL_HINT = (
+    "pdftotext is not installed. Install with: "
+    "brew install poppler (macOS) or "
+    "sudo apt-get install poppler-utils (Linux)"
+)
+
+
+class _Deadline:
+    """Call *on_expire* once *timeout* seconds of unpaused time pass.
+
+    Time spent between ``pause`` and ``resume`` does not count, so a
+    slow consumer of pdftotext's output is not mistaken for a stuck
+    pdftotext.  A single watchdog thread serves the whole run.
+    """
+
+    def __init__(
+        self, timeout: float, on_expire: Callable[[], None]
+    ) -> None:
+        """Start the watchdog.
+
+        :param timeout: Seconds allowed, excluding pauses.
+        :param on_expire: Called from the watchdog thread on expiry.
+        """
+        self.expired = False
+        self._on_expire = on_expire
+        self._cond = threading.Condition()
+        self._deadline = time.monotonic() + timeout
+        self._paused_at: Optional[float] = None
+        self._done = False
+        threading.Thread(
+            target=self._watch, name='pdftotext-deadline', daemon=True
+        ).start()
+
+    def pause(self) -> None:
+        """Stop the clock."""
+        with self._cond:
+            self._paused_at = time.monotonic()
+
+    def resume(self) -> None:
+        """Restart the clock, extending the deadline by the pause."""
+        with self._cond:
+            self._deadline += time.monotonic() - self._paused_at
+            self._paused_at = None
+            self._cond.notify()
+
+    def cancel(self) -> None:
+        """Stop the watchdog without calling *on_expire*."""
+        with self._cond:
+            self._done = True
+            self._cond.notify()
+
+    def _watch(self) -> None:
+        """Wait for the deadline, sleeping through pauses."""
+        with self._cond:
+            while not self._done:
+                if self._paused_at is not None:
+                    self._cond.wait()
+                    continue
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    self.expired = True
+                    break
+                self._cond.wait(remaining)
+        if self.expired:
+            self._on_expire()
+
 
 class PDFIngestor(IngestorInterface):
     """Parse quotes from a PDF file via the pdftotext CLI tool.
@@ -19,16 +89,39 @@ class PDFIngestor(IngestorInterface):
     Requires the ``pdftotext`` utility (part of Poppler / Xpdf).
     Install with ``brew install poppler`` on macOS or
     ``sudo apt-get install poppler-utils`` on Ubuntu/Debian.
+
+    Text is read straight from pdftotext's stdout.  Documents with at
+    least ``parallel_min_pages`` pages are split into page ranges that
+    are converted by concurrent pdftotext processes; quotes are still
+    yielded in document order.
     """
 
     allowed_extensions = ['pdf']
+    io_bound = True
+
+    # Seconds allowed for each pdftotext invocation, not counting time
+    # the caller spends between lines.
+    timeout = 30
+
+    # Page count (from pdfinfo) at which conversion is parallelised.
+    parallel_min_pages = 64
+
+    # Files smaller than this are never split, so pdfinfo is skipped;
+    # a document of ``parallel_min_pages`` pages is rarely this small.
+    parallel_min_bytes = 64 * 1024
+
+    # Pages converted by each pdftotext process in parallel mode.
+    pages_per_chunk = 32
+
+    # Concurrent pdftotext processes (defaults to the number of CPUs).
+    max_workers: Optional[int] = None
 
     @classmethod
-    def parse(cls, path: str) -> List[QuoteModel]:
-        """Parse a .pdf file and return QuoteModel objects.
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """Yield QuoteModel objects from a .pdf file, line by line.
 
         :param path: Path to the .pdf file.
-        :return: List of QuoteModel instances.
+        :return: Iterator of QuoteModel instances.
         :raises FileIngestError: If the file cannot be read or
             pdftotext is not installed.
         """
@@ -40,40 +133,147 @@ class PDFIngestor(IngestorInterface):
 
         logger.info("Parsing PDF file: %s", path)
 
-        tmp_fd, tmp_path = tempfile.mkstemp(suffix='.txt')
-        os.close(tmp_fd)
+        workers = cls.max_workers or os.cpu_count() or 1
+        pages = None
+        if workers > 1 and (
+            os.path.getsize(path) >= cls.parallel_min_bytes
+        ):
+            pages = cls._page_count(path)
 
-        try:
-            result = subprocess.run(
-                ['pdftotext', '-layout', path, tmp_path],
-                capture_output=True, text=True, timeout=30
-            )
-            if result.returncode != 0:
-                raise FileIngestError(
-                    f"pdftotext failed on '{path}': {result.stderr.strip()}"
-                )
+        if pages is None or pages < cls.parallel_min_pages:
+            lines = cls._run_pdftotext(path)
+        else:
+            lines = cls._run_parallel(path, pages, workers)
 
-            with open(tmp_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        except FileNotFoundError as exc:
-            raise FileIngestError(
-                "pdftotext is not installed. Install with: "
-                "brew install poppler (macOS) or "
-                "sudo apt-get install poppler-utils (Linux)"
-            ) from exc
-        except subprocess.TimeoutExpired as exc:
-            raise FileIngestError(
-                f"pdftotext timed out on '{path}'"
-            ) from exc
-        finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-
-        quotes: List[QuoteModel] = []
         for line in lines:
             quote = cls._parse_quote_line(line)
             if quote is not None:
-                quotes.append(quote)
+                yield quote
+
+    # ---------------------------------------------------------------
+    # pdftotext / pdfinfo helpers
+    # ---------------------------------------------------------------
+
+    @classmethod
+    def _run_pdftotext(
+        cls, path: str, first: Optional[int] = None,
+        last: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream the text lines of *path* (or a page range of it).
+
+        :param path: Path to the .pdf file.
+        :param first: First page to convert (1-based, inclusive).
+        :param last: Last page to convert (inclusive).
+        :return: Iterator of text lines.
+        :raises FileIngestError: If pdftotext is missing, fails or
+            times out.
+        """
+        cmd = ['pdftotext', '-layout', '-enc', 'UTF-8']
+        if first is not None:
+            cmd += ['-f', str(first), '-l', str(last)]
+        cmd += [path, '-']
+
+        with tempfile.TemporaryFile() as stderr:
+            try:
+                proc = subprocess.Popen(
+                    cmd, stdout=subprocess.PIPE, stderr=stderr,
+                    encoding='utf-8', errors='replace'
+                )
+            except FileNotFoundError as exc:
+                raise FileIngestError(_INSTALL_HINT) from exc
+
+            deadline = _Deadline(cls.timeout, proc.kill)
+            try:
+                for line in proc.stdout:
+                    deadline.pause()
+                    yield line
+                    deadline.resume()
+                proc.wait()
+            finally:
+                deadline.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+
+            if deadline.expired:
+                raise FileIngestError(f"pdftotext timed out on '{path}'")
+            if proc.returncode != 0:
+                stderr.seek(0)
+                message = stderr.read().decode('utf-8', 'replace').strip()
+                raise FileIngestError(
+                    f"pdftotext failed on '{path}': {message}"
+                )
+
+    @classmethod
+    def _run_parallel(
+        cls, path: str, pages: int, workers: int
+    ) -> Iterator[str]:
+        """Convert page ranges concurrently and yield lines in order.
+
+        At most ``2 * workers`` ranges are in flight at once, so memory
+        stays bounded by the chunk size rather than the document size.
+
+        :param path: Path to the .pdf file.
+        :param pages: Total number of pages.
+        :param workers: Number of concurrent pdftotext processes.
+        :return: Iterator of text lines.
+        """
+        step = cls.pages_per_chunk
+        ranges = (
+            (first, min(first + step - 1, pages))
+            for first in range(1, pages + 1, step)
+        )
+        logger.debug(
+            "Converting %d pages of %s with %d workers",
+            pages, path, workers
+        )
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            window = deque()
+            try:
+                for page_range in ranges:
+                    window.append(
+                        pool.submit(cls._read_range, path, *page_range)
+                    )
+                    if len(window) >= 2 * workers:
+                        yield from window.popleft().result()
+                while window:
+                    yield from window.popleft().result()
+            finally:
+                for future in window:
+                    future.cancel()
+
+    @classmethod
+    def _read_range(cls, path: str, first: int, last: int) -> List[str]:
+        """Return all text lines of one page range.
+
+        :param path: Path to the .pdf file.
+        :param first: First page (inclusive).
+        :param last: Last page (inclusive).
+        :return: List of text lines.
+        """
+        return list(cls._run_pdftotext(path, first, last))
+
+    @classmethod
+    def _page_count(cls, path: str) -> Optional[int]:
+        """Return the page count reported by ``pdfinfo``, if available.
+
+        :param path: Path to the .pdf file.
+        :return: Number of pages, or None when it cannot be determined.
+        """
+        try:
+            result = subprocess.run(
+                ['pdfinfo', path],
+                capture_output=True, text=True, timeout=cls.timeout
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
 
-        logger.info("Parsed %d quotes from %s", len(quotes), path)
-        return quotes
+        for line in result.stdout.splitlines():
+            if line.startswith('Pages:'):
+                try:
+                    return int(line.split(':', 1)[1])
+                except ValueError:
+                    return None
+        return None
@@ -0,0 +1,321 @@
+"""Persistent on-disk cache of parsed quotes, one file per source."""
+
+import hashlib
+import itertools
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from typing import Iterator, Optional, Tuple, Type
+
+from .IngestorInterface import IngestorInterface
+from .QuoteModel import QuoteModel
+
+logger = logging.getLogger(__name__)
+
+# File layout (all integers little-endian):
+#   header:  magic, source size, source mtime_ns, quote count,
+#            length of the record section, sha256, ingestor name
+#            (UTF-8, NUL-padded), ingestor parse_version
+#   records: body length, author length, body UTF-8, author UTF-8
+_MAGIC = b'QCACHE03'
+_HEADER = struct.Struct('<8sQqQQ32s64sI')
+_RECORD = struct.Struct('<II')
+
+
+class QuoteCache:
+    """Store parsed quotes in compact binary files keyed by source.
+
+    A cache file records the size, modification time and SHA-256 of
+    the source it was built from.  When size and mtime still match the
+    cached quotes are read back directly (via ``mmap``).  When only the
+    mtime changed but the content hash is the same, the entry is
+    refreshed without re-parsing.  Otherwise the real ingestor runs
+    and a new cache file is written as its quotes stream past.  An
+    entry written by a different ingestor, or by an older
+    ``parse_version`` of it, is treated as a miss.
+
+    A cache file whose length does not match its header is ignored,
+    and one found to be corrupt while reading is deleted and rebuilt
+    from the source, continuing after the quotes already yielded.
+
+    With a metrics hook, lookups are counted in
+    ``quote_cache_requests_total`` as ``hit``, ``refreshed`` or
+    ``miss``.  The hook is not pickled, so worker processes that
+    receive the cache do not report.
+    """
+
+    def __init__(self, cache_dir: str, metrics=None) -> None:
+        """Create a cache rooted at *cache_dir*.
+
+        :param cache_dir: Directory holding the cache files.
+        :param metrics: Optional metrics hook (see ``metrics.py``).
+        """
+        self.cache_dir = cache_dir
+        self.metrics = metrics
+
+    def __getstate__(self) -> dict:
+        """Pickle without the metrics hook, which is per process."""
+        return {**self.__dict__, 'metrics': None}
+
+    def iter_parse(
+        self, path: str, ingestor: Type[IngestorInterface]
+    ) -> Iterator[QuoteModel]:
+        """Yield the quotes of *path*, from the cache when it is valid.
+
+        :param path: Path to the quote file.
+        :param ingestor: Ingestor used when the cache is stale.
+        :return: Iterator of QuoteModel instances.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Let the ingestor report the problem in its usual way
+            yield from ingestor.iter_parse(path)
+            return
+
+        cache_path = self._cache_path(path)
+        header = self._read_header(cache_path, ingestor)
+        if header is not None:
+            size, mtime_ns, count, digest = header
+            if (size, mtime_ns) == (st.st_size, st.st_mtime_ns):
+                logger.info("Loading %d cached quotes for %s", count, path)
+                self._count('hit')
+                yield from self._read_cached(path, st, cache_path, ingestor)
+                return
+            if size == st.st_size and digest == self._hash_file(path):
+                logger.info("Source unchanged, reusing cache for %s", path)
+                self._touch_header(cache_path, st.st_mtime_ns)
+                self._count('refreshed')
+                yield from self._read_cached(path, st, cache_path, ingestor)
+                return
+
+        self._count('miss')
+        yield from self._write_through(path, st, ingestor)
+
+    def clear(self) -> None:
+        """Delete every cache file."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.qc'):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    # -------------------------------------------------------------------
+    # Private helpers
+    # -------------------------------------------------------------------
+
+    def _count(self, result: str) -> None:
+        """Record a lookup outcome via the metrics hook, if any.
+
+        :param result: ``hit``, ``refreshed`` or ``miss``.
+        """
+        if self.metrics is not None:
+            self.metrics.inc('quote_cache_requests_total', result=result)
+
+    def _cache_path(self, path: str) -> str:
+        """Return the cache file used for the source at *path*.
+
+        :param path: Path to the quote file.
+        :return: Path of the cache file.
+        """
+        key = hashlib.sha1(os.path.abspath(path).encode('utf-8'))
+        return os.path.join(self.cache_dir, key.hexdigest() + '.qc')
+
+    @staticmethod
+    def _hash_file(path: str) -> bytes:
+        """Return the SHA-256 digest of a file's contents.
+
+        :param path: File to hash.
+        :return: 32-byte digest.
+        """
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        return h.digest()
+
+    @staticmethod
+    def _parser_tag(ingestor: Type[IngestorInterface]) -> Tuple[bytes, int]:
+        """Identify the parser that produces an entry's quotes.
+
+        :param ingestor: Ingestor class.
+        :return: ``(name, parse_version)`` as stored in the header.
+        """
+        name = f'{ingestor.__module__}.{ingestor.__qualname__}'
+        return name.encode('utf-8')[:64], ingestor.parse_version
+
+    @classmethod
+    def _read_header(
+        cls, cache_path: str, ingestor: Type[IngestorInterface]
+    ) -> Optional[Tuple]:
+        """Read a cache file's header.
+
+        :param cache_path: Path of the cache file.
+        :param ingestor: Ingestor that would parse the source.
+        :return: ``(size, mtime_ns, count, sha256)`` or None if the
+            file is missing, not a cache file, truncated, or written
+            by another parser.
+        """
+        try:
+            with open(cache_path, 'rb') as f:
+                raw = f.read(_HEADER.size)
+                file_size = os.fstat(f.fileno()).st_size
+        except OSError:
+            return None
+        if len(raw) != _HEADER.size:
+            return None
+        (magic, size, mtime_ns, count, records_len, digest,
+         name, version) = _HEADER.unpack(raw)
+        if magic != _MAGIC or file_size != _HEADER.size + records_len:
+            return None
+        if (name.rstrip(b'\0'), version) != cls._parser_tag(ingestor):
+            return None
+        return size, mtime_ns, count, digest
+
+    @staticmethod
+    def _touch_header(cache_path: str, mtime_ns: int) -> None:
+        """Record a new source mtime in an existing cache file.
+
+        :param cache_path: Path of the cache file.
+        :param mtime_ns: The source's current mtime in nanoseconds.
+        """
+        try:
+            with open(cache_path, 'r+b') as f:
+                f.seek(struct.calcsize('<8sQ'))
+                f.write(struct.pack('<q', mtime_ns))
+        except OSError as exc:
+            logger.warning("Cannot update cache %s: %s", cache_path, exc)
+
+    def _read_cached(
+        self, path: str, st: os.stat_result, cache_path: str,
+        ingestor: Type[IngestorInterface]
+    ) -> Iterator[QuoteModel]:
+        """Yield cached quotes, rebuilding the entry if it is corrupt.
+
+        :param path: Path to the quote file.
+        :param st: ``os.stat`` result of the source.
+        :param cache_path: Path of the cache file.
+        :param ingestor: Ingestor used to rebuild a corrupt entry.
+        :return: Iterator of QuoteModel instances.
+        """
+        yielded = 0
+        try:
+            for quote in self._read_quotes(cache_path):
+                yielded += 1
+                yield quote
+            return
+        except (OSError, struct.error, ValueError) as exc:
+            logger.warning(
+                "Discarding corrupt quote cache for %s: %s", path, exc
+            )
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+        # The quotes before the damage were valid; don't repeat them
+        yield from itertools.islice(
+            self._write_through(path, st, ingestor), yielded, None
+        )
+
+    @staticmethod
+    def _read_quotes(cache_path: str) -> Iterator[QuoteModel]:
+        """Yield the quotes stored in a cache file.
+
+        :param cache_path: Path of the cache file.
+        :return: Iterator of QuoteModel instances.
+        :raises ValueError: If a record runs past the end of the file
+            or is not valid UTF-8.
+        :raises struct.error: If a record header is cut off.
+        """
+        with open(cache_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            count = _HEADER.unpack_from(buf)[3]
+            offset = _HEADER.size
+            for _ in range(count):
+                body_len, author_len = _RECORD.unpack_from(buf, offset)
+                offset += _RECORD.size
+                if offset + body_len + author_len > len(buf):
+                    raise ValueError(f"record at {offset} is truncated")
+                body = buf[offset:offset + body_len].decode('utf-8')
+                offset += body_len
+                author = buf[offset:offset + author_len].decode('utf-8')
+                offset += author_len
+                yield QuoteModel(body, author)
+
+    def _write_through(
+        self, path: str, st: os.stat_result,
+        ingestor: Type[IngestorInterface]
+    ) -> Iterator[QuoteModel]:
+        """Parse *path* with *ingestor*, caching quotes as they stream.
+
+        The cache file only replaces the old one once parsing finishes,
+        so a failed or abandoned parse never leaves a partial entry.
+
+        :param path: Path to the quote file.
+        :param st: ``os.stat`` result taken before parsing.
+        :param ingestor: Ingestor class to parse with.
+        :return: Iterator of QuoteModel instances.
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            digest = self._hash_file(path)
+            tmp_fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_dir, suffix='.tmp'
+            )
+            f = os.fdopen(tmp_fd, 'wb')
+            f.write(b'\0' * _HEADER.size)
+        except OSError as exc:
+            logger.warning("Quote cache unavailable for %s: %s", path, exc)
+            yield from ingestor.iter_parse(path)
+            return
+
+        try:
+            count = 0
+            for quote in ingestor.iter_parse(path):
+                count += 1
+                if not f.closed:
+                    self._write_record(f, quote, path)
+                yield quote
+
+            if not f.closed:
+                try:
+                    records_len = f.tell() - _HEADER.size
+                    f.seek(0)
+                    f.write(_HEADER.pack(
+                        _MAGIC, st.st_size, st.st_mtime_ns, count,
+                        records_len, digest, *self._parser_tag(ingestor)
+                    ))
+                    f.close()
+                    os.replace(tmp_path, self._cache_path(path))
+                    logger.info("Cached %d quotes for %s", count, path)
+                except OSError as exc:
+                    logger.warning(
+                        "Cannot write quote cache for %s: %s", path, exc
+                    )
+        finally:
+            f.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def _write_record(f, quote: QuoteModel, path: str) -> None:
+        """Append one quote to an open cache file.
+
+        On a write error the file is closed, which stops further
+        caching for this parse without interrupting it.
+
+        :param f: Cache file opened for binary writing.
+        :param quote: Quote to append.
+        :param path: Source path (for logging).
+        """
+        body = quote.body.encode('utf-8')
+        author = quote.author.encode('utf-8')
+        try:
+            f.write(_RECORD.pack(len(body), len(author)))
+            f.write(body)
+            f.write(author)
+        except OSError as exc:
+            logger.warning("Cannot write quote cache for %s: %s", path, exc)
+            f.close()
@@ -0,0 +1,167 @@
+"""Compact, columnar storage for large numbers of quotes."""
+
+import random
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, List, Optional, Union
+
+from .QuoteModel import QuoteModel
+
+
+class QuoteCorpus(Sequence):
+    """Store quotes in packed buffers instead of one object per quote.
+
+    Bodies are concatenated into a single UTF-8 ``bytearray`` indexed
+    by an offset array, and authors are interned so that each distinct
+    author is stored once and referenced by a small integer.  Indexing
+    builds a ``QuoteModel`` on demand, so the corpus costs a few bytes
+    of overhead per quote rather than a full Python object.
+    """
+
+    def __init__(self, quotes: Iterable[QuoteModel] = ()) -> None:
+        """Create a corpus, optionally filled from *quotes*.
+
+        :param quotes: Iterable of QuoteModel (or another QuoteCorpus).
+        """
+        self._bodies = bytearray()
+        self._offsets = array('Q', [0])
+        self._author_ids = array('I')
+        self._authors: List[str] = []
+        self._author_lookup: Dict[str, int] = {}
+        self.extend(quotes)
+
+    # -------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------
+
+    def add(self, body: str, author: str) -> int:
+        """Append a quote given its parts.
+
+        :param body: Quote body (stripped like ``QuoteModel``).
+        :param author: Quote author (stripped like ``QuoteModel``).
+        :return: Index of the new quote.
+        """
+        self._bodies += body.strip().encode('utf-8')
+        self._offsets.append(len(self._bodies))
+        self._author_ids.append(self._intern(author.strip()))
+        return len(self._author_ids) - 1
+
+    def append(self, quote: QuoteModel) -> int:
+        """Append a QuoteModel.
+
+        :param quote: The quote to store.
+        :return: Index of the new quote.
+        """
+        return self.add(quote.body, quote.author)
+
+    def extend(
+        self, quotes: Union['QuoteCorpus', Iterable[QuoteModel]]
+    ) -> None:
+        """Append many quotes.
+
+        Another ``QuoteCorpus`` is merged buffer-to-buffer without
+        materialising its quotes.
+
+        :param quotes: Iterable of QuoteModel or a QuoteCorpus.
+        """
+        if not isinstance(quotes, QuoteCorpus):
+            for quote in quotes:
+                self.add(quote.body, quote.author)
+            return
+
+        base = len(self._bodies)
+        self._bodies += quotes._bodies
+        self._offsets.extend(base + off for off in quotes._offsets[1:])
+        remap = [self._intern(author) for author in quotes._authors]
+        self._author_ids.extend(remap[i] for i in quotes._author_ids)
+
+    def _intern(self, author: str) -> int:
+        """Return the id of *author*, registering it if new.
+
+        :param author: Author name.
+        :return: Integer author id.
+        """
+        author_id = self._author_lookup.get(author)
+        if author_id is None:
+            author_id = len(self._authors)
+            self._authors.append(author)
+            self._author_lookup[author] = author_id
+        return author_id
+
+    # -------------------------------------------------------------------
+    # Access
+    # -------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Return the number of quotes."""
+        return len(self._author_ids)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[QuoteModel, List[QuoteModel]]:
+        """Return the quote at *index* as a new QuoteModel.
+
+        :param index: Position in the corpus (negative counts from
+            end), or a slice.
+        :return: A QuoteModel, or a list of them for a slice.
+        :raises IndexError: If *index* is out of range.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('QuoteCorpus index out of range')
+        return QuoteModel(self.body(index), self.author(index))
+
+    def body(self, index: int) -> str:
+        """Return the body of the quote at *index*.
+
+        :param index: Position in the corpus (0 <= index < len).
+        :return: Quote body.
+        """
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return self._bodies[start:end].decode('utf-8')
+
+    def author(self, index: int) -> str:
+        """Return the author of the quote at *index*.
+
+        :param index: Position in the corpus (0 <= index < len).
+        :return: Quote author.
+        """
+        return self._authors[self._author_ids[index]]
+
+    def author_id(self, index: int) -> int:
+        """Return the interned author id of the quote at *index*.
+
+        :param index: Position in the corpus (0 <= index < len).
+        :return: Integer author id.
+        """
+        return self._author_ids[index]
+
+    @property
+    def authors(self) -> List[str]:
+        """Return the distinct authors, indexed by author id."""
+        return list(self._authors)
+
+    def random_choice(
+        self, rng: Optional[random.Random] = None
+    ) -> QuoteModel:
+        """Return a uniformly random quote.
+
+        :param rng: Random generator (defaults to the ``random`` module).
+        :return: A QuoteModel.
+        :raises IndexError: If the corpus is empty.
+        """
+        if not self:
+            raise IndexError('Cannot choose from an empty QuoteCorpus')
+        return self[(rng or random).randrange(len(self))]
+
+    def nbytes(self) -> int:
+        """Return the approximate size of the packed buffers in bytes."""
+        return (
+            len(self._bodies)
+            + self._offsets.itemsize * len(self._offsets)
+            + self._author_ids.itemsize * len(self._author_ids)
+            + sum(len(a) for a in self._authors)
+        )
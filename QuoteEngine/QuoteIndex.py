@@ -0,0 +1,224 @@
+"""Inverted index for keyword and author lookups over a QuoteCorpus."""
+
+import bisect
+import logging
+import random
+import re
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from .QuoteCorpus import QuoteCorpus
+from .QuoteModel import QuoteModel
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+(?:'\w+)*")
+
+# Random probes tried before falling back to a full intersection.
+_SAMPLE_ATTEMPTS = 256
+
+
+def tokenize(text: str) -> List[str]:
+    """Split *text* into lower-cased word tokens.
+
+    :param text: Text to tokenize.
+    :return: List of tokens (apostrophes inside words are kept).
+    """
+    return _TOKEN_RE.findall(text.casefold())
+
+
+class QuoteIndex:
+    """Map body tokens and authors to the ids of matching quotes.
+
+    Posting lists are sorted ``array('I')`` of corpus indices, so a
+    single-term lookup is a dictionary hit and multi-term queries are
+    answered by probing the shorter list against the longer ones with
+    binary search.  Quote ids (``QuoteModel.quote_id``) are kept in a
+    sorted ``array('Q')`` built alongside, so ``find`` never has to
+    hash the corpus on the request path.
+    """
+
+    def __init__(self, corpus: QuoteCorpus) -> None:
+        """Build the index for *corpus*.
+
+        :param corpus: The corpus to index; it must not change after
+            the index is built.
+        """
+        self.corpus = corpus
+        self._tokens: Dict[str, array] = {}
+        self._authors: Dict[str, array] = {}
+
+        ids = array('Q')
+        authors = corpus.authors
+        author_keys = [a.casefold() for a in authors]
+        for i in range(len(corpus)):
+            body = corpus.body(i)
+            ids.append(int.from_bytes(QuoteModel.id_digest(
+                body, authors[corpus.author_id(i)]
+            ), 'big'))
+
+            for token in set(tokenize(body)):
+                postings = self._tokens.get(token)
+                if postings is None:
+                    postings = self._tokens[token] = array('I')
+                postings.append(i)
+
+            key = author_keys[corpus.author_id(i)]
+            postings = self._authors.get(key)
+            if postings is None:
+                postings = self._authors[key] = array('I')
+            postings.append(i)
+
+        # Quote ids sorted for binary search, with their corpus indices
+        order = sorted(range(len(ids)), key=ids.__getitem__)
+        self._id_keys = array('Q', (ids[i] for i in order))
+        self._id_positions = array('I', order)
+
+        logger.info(
+            "Indexed %d quotes (%d tokens, %d authors)",
+            len(corpus), len(self._tokens), len(self._authors)
+        )
+
+    def search(
+        self, q: Optional[str] = None, author: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[int]:
+        """Return ids of quotes matching every word of *q* and *author*.
+
+        Matching is case-insensitive; *author* must equal the whole
+        author name.  With neither filter every quote matches.
+
+        :param q: Space-separated keywords, all of which must appear.
+        :param author: Author name.
+        :param limit: Maximum number of ids to return.
+        :return: Sorted list of corpus indices.
+        """
+        lists = self._postings(q, author)
+        if lists is None:
+            ids: Sequence[int] = range(len(self.corpus))
+        else:
+            ids = self._intersect(lists)
+        if limit is not None:
+            ids = ids[:limit]
+        return list(ids)
+
+    def find(self, quote_id: int) -> Optional[QuoteModel]:
+        """Return the quote whose ``QuoteModel.quote_id`` is *quote_id*.
+
+        :param quote_id: The id, as an integer.
+        :return: The quote, or None if it is not in the corpus.
+        """
+        keys = self._id_keys
+        pos = bisect.bisect_left(keys, quote_id)
+        if pos < len(keys) and keys[pos] == quote_id:
+            return self.corpus[self._id_positions[pos]]
+        return None
+
+    def candidate_count(
+        self, q: Optional[str] = None, author: Optional[str] = None
+    ) -> int:
+        """Return an upper bound on the number of matching quotes.
+
+        This is the length of the shortest posting list involved, which
+        is exact for single-term and author-only queries.
+
+        :param q: Space-separated keywords.
+        :param author: Author name.
+        :return: Number of candidate quotes.
+        """
+        lists = self._postings(q, author)
+        if lists is None:
+            return len(self.corpus)
+        return min(len(postings) for postings in lists)
+
+    def random_choice(
+        self, q: Optional[str] = None, author: Optional[str] = None,
+        rng: Optional[random.Random] = None
+    ) -> Optional[QuoteModel]:
+        """Return a random quote matching *q* and *author*.
+
+        For multi-term queries random members of the shortest posting
+        list are probed against the others first, which is uniform over
+        the matches and avoids a full intersection unless matches are
+        rare.
+
+        :param q: Space-separated keywords, all of which must appear.
+        :param author: Author name.
+        :param rng: Random generator (defaults to the ``random`` module).
+        :return: A matching QuoteModel, or None if nothing matches.
+        """
+        rng = rng or random
+        lists = self._postings(q, author)
+        if lists is None:
+            return self.corpus.random_choice(rng) if self.corpus else None
+
+        lists.sort(key=len)
+        smallest, others = lists[0], lists[1:]
+        if not smallest:
+            return None
+
+        for _ in range(_SAMPLE_ATTEMPTS if others else 1):
+            i = smallest[rng.randrange(len(smallest))]
+            if all(self._contains(other, i) for other in others):
+                return self.corpus[i]
+
+        ids = self._intersect(lists)
+        if not ids:
+            return None
+        return self.corpus[ids[rng.randrange(len(ids))]]
+
+    # -------------------------------------------------------------------
+    # Private helpers
+    # -------------------------------------------------------------------
+
+    def _postings(
+        self, q: Optional[str], author: Optional[str]
+    ) -> Optional[List[array]]:
+        """Collect the posting lists a query must intersect.
+
+        :param q: Keyword query.
+        :param author: Author name.
+        :return: List of posting lists (an empty array when some term
+            has no matches, or *q* has no word tokens), or None when
+            there is no filter at all.
+        """
+        terms = tokenize(q) if q else []
+        empty = array('I')
+        if q and q.strip() and not terms:
+            # Keywords with no word characters can match nothing
+            return [empty]
+        if not terms and not author:
+            return None
+
+        lists = [self._tokens.get(term, empty) for term in set(terms)]
+        if author:
+            lists.append(self._authors.get(author.strip().casefold(), empty))
+        return lists
+
+    @staticmethod
+    def _intersect(lists: List[array]) -> List[int]:
+        """Intersect sorted posting lists.
+
+        :param lists: Sorted posting lists.
+        :return: Sorted ids present in every list.
+        """
+        lists = sorted(lists, key=len)
+        if len(lists) == 1:
+            return list(lists[0])
+
+        smallest, others = lists[0], lists[1:]
+        return [
+            i for i in smallest
+            if all(QuoteIndex._contains(other, i) for other in others)
+        ]
+
+    @staticmethod
+    def _contains(postings: array, i: int) -> bool:
+        """Return True if sorted *postings* contains *i*.
+
+        :param postings: Sorted posting list.
+        :param i: Quote id.
+        :return: Whether *i* is present.
+        """
+        pos = bisect.bisect_left(postings, i)
+        return pos < len(postings) and postings[pos] == i
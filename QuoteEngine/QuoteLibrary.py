@@ -0,0 +1,168 @@
+"""Immutable, per-source collection of indexed quote corpora."""
+
+import bisect
+import itertools
+import logging
+import random
+from typing import Dict, List, Mapping, NamedTuple, Optional
+
+from .QuoteCorpus import QuoteCorpus
+from .QuoteIndex import QuoteIndex
+from .QuoteModel import QuoteModel
+
+logger = logging.getLogger(__name__)
+
+_HEX_DIGITS = frozenset('0123456789abcdef')
+
+
+class Segment(NamedTuple):
+    """The quotes of one source file and their index."""
+
+    corpus: QuoteCorpus
+    index: QuoteIndex
+
+
+class QuoteLibrary:
+    """Quotes grouped by the source file they came from.
+
+    A library is never modified in place: ``with_source`` and
+    ``without_source`` return a new library that shares every untouched
+    segment with the old one.  Replacing one file therefore costs only
+    the parse and index of that file, and readers holding the old
+    library keep a consistent view while the new one is published.
+    """
+
+    def __init__(
+        self, segments: Optional[Mapping[str, Segment]] = None
+    ) -> None:
+        """Create a library from already indexed segments.
+
+        :param segments: Ordered mapping of source path to Segment.
+        """
+        self._segments: Dict[str, Segment] = dict(segments or {})
+        self._order = list(self._segments.values())
+        self._starts = list(itertools.accumulate(
+            (len(seg.corpus) for seg in self._order), initial=0
+        ))
+
+    @classmethod
+    def from_corpora(
+        cls, corpora: Mapping[str, QuoteCorpus]
+    ) -> 'QuoteLibrary':
+        """Index each corpus and build a library from them.
+
+        :param corpora: Ordered mapping of source path to QuoteCorpus.
+        :return: A new QuoteLibrary.
+        """
+        return cls({
+            path: Segment(corpus, QuoteIndex(corpus))
+            for path, corpus in corpora.items()
+        })
+
+    # -------------------------------------------------------------------
+    # Copy-on-write updates
+    # -------------------------------------------------------------------
+
+    def with_source(
+        self, path: str, corpus: QuoteCorpus
+    ) -> 'QuoteLibrary':
+        """Return a library with *path*'s quotes added or replaced.
+
+        :param path: Source file path.
+        :param corpus: The file's freshly parsed quotes.
+        :return: A new QuoteLibrary.
+        """
+        segments = dict(self._segments)
+        segments[path] = Segment(corpus, QuoteIndex(corpus))
+        return QuoteLibrary(segments)
+
+    def without_source(self, path: str) -> 'QuoteLibrary':
+        """Return a library without *path*'s quotes.
+
+        :param path: Source file path.
+        :return: A new QuoteLibrary (self if *path* is not present).
+        """
+        if path not in self._segments:
+            return self
+        segments = dict(self._segments)
+        del segments[path]
+        return QuoteLibrary(segments)
+
+    # -------------------------------------------------------------------
+    # Access
+    # -------------------------------------------------------------------
+
+    @property
+    def sources(self) -> List[str]:
+        """Return the source paths in the library."""
+        return list(self._segments)
+
+    def __len__(self) -> int:
+        """Return the total number of quotes."""
+        return self._starts[-1]
+
+    def __getitem__(self, index: int) -> QuoteModel:
+        """Return the quote at a library-wide *index*.
+
+        :param index: Position across all segments.
+        :return: A QuoteModel.
+        :raises IndexError: If *index* is out of range.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('QuoteLibrary index out of range')
+        seg = bisect.bisect_right(self._starts, index) - 1
+        return self._order[seg].corpus[index - self._starts[seg]]
+
+    def find(self, quote_id: str) -> Optional[QuoteModel]:
+        """Return the quote with the given ``QuoteModel.quote_id``.
+
+        :param quote_id: 16 lower-case hex digits.
+        :return: The quote, or None if the id is malformed or unknown.
+        """
+        if len(quote_id) != 16 or not _HEX_DIGITS.issuperset(quote_id):
+            return None
+        key = int(quote_id, 16)
+        for seg in self._order:
+            quote = seg.index.find(key)
+            if quote is not None:
+                return quote
+        return None
+
+    def random_choice(
+        self, q: Optional[str] = None, author: Optional[str] = None,
+        rng: Optional[random.Random] = None
+    ) -> Optional[QuoteModel]:
+        """Return a random quote, optionally filtered by *q*/*author*.
+
+        A segment is chosen with probability proportional to its number
+        of candidates, then a match is drawn from it.  Selection is
+        uniform for unfiltered, author-only and single-keyword queries.
+
+        :param q: Space-separated keywords, all of which must appear.
+        :param author: Author name.
+        :param rng: Random generator (defaults to the ``random`` module).
+        :return: A matching QuoteModel, or None if nothing matches.
+        """
+        rng = rng or random
+        if not q and not author:
+            return self[rng.randrange(len(self))] if len(self) else None
+
+        weights = [
+            seg.index.candidate_count(q, author) for seg in self._order
+        ]
+        while True:
+            total = sum(weights)
+            if not total:
+                return None
+            pick = rng.randrange(total)
+            for i, weight in enumerate(weights):
+                if pick < weight:
+                    break
+                pick -= weight
+
+            quote = self._order[i].index.random_choice(q, author, rng)
+            if quote is not None:
+                return quote
+            weights[i] = 0
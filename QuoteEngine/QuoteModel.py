@@ -1,9 +1,13 @@
 """QuoteModel encapsulates a quote body and author."""
 
+import hashlib
+
 
 class QuoteModel:
     """Represent a quote with a body and an author."""
 
+    __slots__ = ('body', 'author')
+
     def __init__(self, body: str, author: str) -> None:
         """Create a new QuoteModel.
 
@@ -13,6 +17,32 @@ class QuoteModel:
         self.body = body.strip()
         self.author = author.strip()
 
+    @property
+    def quote_id(self) -> str:
+        """Return a stable id derived from the body and author."""
+        return self.id_for(self.body, self.author)
+
+    @staticmethod
+    def id_for(body: str, author: str) -> str:
+        """Return the id of the quote with *body* and *author*.
+
+        :param body: The (stripped) text of the quote.
+        :param author: The (stripped) author.
+        :return: 16 hex digits.
+        """
+        return QuoteModel.id_digest(body, author).hex()
+
+    @staticmethod
+    def id_digest(body: str, author: str) -> bytes:
+        """Return the 8-byte digest behind ``id_for``.
+
+        :param body: The (stripped) text of the quote.
+        :param author: The (stripped) author.
+        :return: The raw digest.
+        """
+        key = f'{body}\0{author}'.encode('utf-8')
+        return hashlib.blake2b(key, digest_size=8).digest()
+
     def __repr__(self) -> str:
         """Return a developer-friendly string representation."""
         return f'QuoteModel(body="{self.body}", author="{self.author}")'
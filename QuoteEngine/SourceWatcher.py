@@ -0,0 +1,133 @@
+"""Detect added, modified and removed files by polling their mtimes."""
+
+import logging
+import os
+import threading
+from typing import (
+    Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+)
+
+logger = logging.getLogger(__name__)
+
+_Snapshot = Dict[str, Tuple[int, int]]
+
+
+class Changes(NamedTuple):
+    """Files that changed between two polls."""
+
+    added: List[str]
+    modified: List[str]
+    removed: List[str]
+
+    def __bool__(self) -> bool:
+        """Return True if anything changed."""
+        return bool(self.added or self.modified or self.removed)
+
+
+class SourceWatcher:
+    """Watch files and directory trees for changes.
+
+    Each poll stats every watched file and compares its modification
+    time and size with the previous poll.  Polling is portable and
+    needs no extra dependencies; the work per poll is one ``stat`` per
+    file, independent of file sizes.
+    """
+
+    def __init__(
+        self, roots: Iterable[str],
+        accept: Callable[[str], bool] = lambda path: True
+    ) -> None:
+        """Watch *roots* (files or directories).
+
+        The current state is recorded immediately, so the first
+        ``poll`` only reports changes made after construction.
+
+        :param roots: Files and/or directories to watch.
+        :param accept: Predicate selecting which files found in a
+            directory are watched.
+        """
+        self.roots = list(roots)
+        self.accept = accept
+        self._snapshot = self._scan()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def poll(self) -> Changes:
+        """Return the changes since the previous poll.
+
+        :return: Added, modified and removed paths, each sorted.
+        """
+        old, new = self._snapshot, self._scan()
+        self._snapshot = new
+        return Changes(
+            added=sorted(new.keys() - old.keys()),
+            modified=sorted(
+                p for p in new.keys() & old.keys() if new[p] != old[p]
+            ),
+            removed=sorted(old.keys() - new.keys()),
+        )
+
+    def start(
+        self, callback: Callable[[Changes], None], interval: float = 2.0
+    ) -> threading.Thread:
+        """Poll every *interval* seconds in a daemon thread.
+
+        *callback* runs on the watcher thread whenever something
+        changed; exceptions it raises are logged, not propagated.
+
+        :param callback: Function called with each non-empty Changes.
+        :param interval: Seconds between polls.
+        :return: The watcher thread.
+        """
+        def run() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    changes = self.poll()
+                    if changes:
+                        callback(changes)
+                except Exception:
+                    logger.exception("Error while handling file changes")
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=run, name='source-watcher', daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        """Stop the polling thread started by ``start``."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _scan(self) -> _Snapshot:
+        """Stat every watched file.
+
+        :return: Mapping of path to ``(mtime_ns, size)``.
+        """
+        snapshot: _Snapshot = {}
+        for root in self.roots:
+            if os.path.isdir(root):
+                for dirpath, dirs, files in os.walk(root):
+                    for name in files:
+                        path = os.path.join(dirpath, name)
+                        if self.accept(path):
+                            self._stat_into(snapshot, path)
+            else:
+                self._stat_into(snapshot, root)
+        return snapshot
+
+    @staticmethod
+    def _stat_into(snapshot: _Snapshot, path: str) -> None:
+        """Record *path*'s mtime and size, ignoring vanished files.
+
+        :param snapshot: Snapshot being built.
+        :param path: File to stat.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        snapshot[path] = (st.st_mtime_ns, st.st_size)
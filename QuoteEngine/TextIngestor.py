@@ -1,7 +1,7 @@
 """Ingestor for plain-text (.txt) quote files."""
 
 import logging
-from typing import List
+from typing import Iterator
 
 from .IngestorInterface import IngestorInterface
 from .QuoteModel import QuoteModel
@@ -17,27 +17,27 @@ class TextIngestor(IngestorInterface):
     """
 
     allowed_extensions = ['txt']
+    io_bound = True
 
     @classmethod
-    def parse(cls, path: str) -> List[QuoteModel]:
-        """Parse a .txt file and return QuoteModel objects.
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """Yield QuoteModel objects from a .txt file, line by line.
 
         :param path: Path to the .txt file.
-        :return: List of QuoteModel instances.
+        :return: Iterator of QuoteModel instances.
         :raises FileIngestError: If the file cannot be read.
         """
         if not cls.can_ingest(path):
             raise FileIngestError(f"TextIngestor cannot ingest '{path}'")
 
         logger.info("Parsing text file: %s", path)
-        quotes: List[QuoteModel] = []
 
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 for line in f:
                     quote = cls._parse_quote_line(line)
                     if quote is not None:
-                        quotes.append(quote)
+                        yield quote
         except FileNotFoundError as exc:
             raise FileIngestError(f"File not found: {path}") from exc
         except PermissionError as exc:
@@ -46,6 +46,3 @@ class TextIngestor(IngestorInterface):
             raise FileIngestError(
                 f"Cannot decode file (not valid UTF-8): {path}"
             ) from exc
-
-        logger.info("Parsed %d quotes from %s", len(quotes), path)
-        return quotes
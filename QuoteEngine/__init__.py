@@ -1,7 +1,15 @@
 """QuoteEngine package — parse quotes from various file formats."""
 
+from .CorpusLoader import CorpusLoader
 from .Ingestor import Ingestor
 from .IngestorInterface import IngestorInterface
+from .QuoteCache import QuoteCache
+from .QuoteCorpus import QuoteCorpus
+from .QuoteIndex import QuoteIndex
+from .QuoteLibrary import QuoteLibrary
 from .QuoteModel import QuoteModel
+from .SourceWatcher import Changes, SourceWatcher
 
-__all__ = ['Ingestor', 'IngestorInterface', 'QuoteModel']
+__all__ = ['Changes', 'CorpusLoader', 'Ingestor', 'IngestorInterface',
+           'QuoteCache', 'QuoteCorpus', 'QuoteIndex', 'QuoteLibrary',
+           'QuoteModel', 'SourceWatcher']
@@ -1,17 +1,33 @@
 """Flask web application for generating memes."""
 
+import gc
+import hashlib
 import logging
 import os
 import random
-import tempfile
+import threading
+import time
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
 
-import requests
-from flask import Flask, render_template, request
+from flask import (
+    Flask, Response, abort, g, redirect, render_template, request,
+    send_file, url_for
+)
 
-from MemeEngine import MemeEngine
-from MemeEngine.exceptions import MemeGenerationError
-from QuoteEngine import Ingestor
+from MemeEngine import (
+    ImageFetcher, MemeEngine, MemeJob, MemePool, OutputEncoder,
+    RenderScheduler
+)
+from MemeEngine.OutputEncoder import encoder_for_mimetype, supported_mimetypes
+from MemeEngine.exceptions import (
+    ImageFetchError, MemeGenerationError, SchedulerError
+)
+from QuoteEngine import (
+    Changes, CorpusLoader, Ingestor, QuoteCache, QuoteCorpus, QuoteLibrary,
+    QuoteModel, SourceWatcher
+)
 from QuoteEngine.exceptions import QuoteEngineError
+from metrics import MetricsRegistry
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,49 +37,530 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
-meme = MemeEngine('./static')
+# Per-stage timings and cache counters, served at /metrics (0 disables;
+# every instrumented component then skips its timers entirely).
+METRICS_ENABLED = os.environ.get('APP_METRICS', '1') == '1'
+registry = MetricsRegistry() if METRICS_ENABLED else None
+
+if registry is not None:
+    for _name, _help in {
+        'meme_stage_seconds': 'Time spent in each meme rendering stage.',
+        'meme_cache_requests_total':
+            'Source image, caption layer and output lookups by result.',
+        'image_fetch_seconds': 'Time to fetch a /create source image.',
+        'image_fetch_total': 'Source image fetches by outcome.',
+        'quote_ingest_seconds': 'Time to ingest one quote source.',
+        'quotes_ingested_total': 'Quotes ingested, by ingestor.',
+        'quote_cache_requests_total': 'Parsed-quote cache lookups.',
+        'meme_pool_requests_total': 'Pre-rendered meme pops by result.',
+        'scheduler_rejected_total': 'Jobs rejected on a full queue.',
+        'scheduler_timeouts_total': 'Jobs that missed their deadline.',
+        'http_request_seconds': 'Request handling time by endpoint.',
+        'http_requests_total': 'Requests by endpoint and status.',
+    }.items():
+        registry.describe(_name, _help)
+
+# Output format ("png", "jpeg" or "webp") and encoder preset ("default",
+# "fast" for lowest latency or "small" for fewest bytes).
+OUTPUT_FORMAT = os.environ.get('APP_OUTPUT_FORMAT', 'png')
+OUTPUT_PRESET = os.environ.get('APP_OUTPUT_PRESET', 'default')
+
+# Pick the output format per request from the Accept header.
+NEGOTIATE_FORMAT = os.environ.get('APP_NEGOTIATE_FORMAT') == '1'
+
+# Budget for generated memes in ./static; least recently used are evicted.
+OUTPUT_MAX_BYTES = int(os.environ.get('APP_OUTPUT_MAX_BYTES', 256 << 20))
+OUTPUT_MAX_FILES = int(os.environ.get('APP_OUTPUT_MAX_FILES', 10000))
+
+meme = MemeEngine(
+    './static', deterministic=True,
+    encoder=f'{OUTPUT_FORMAT}:{OUTPUT_PRESET}',
+    max_output_bytes=OUTPUT_MAX_BYTES, max_output_files=OUTPUT_MAX_FILES,
+    metrics=registry
+)
+
+# Encoders by MIME type, most preferred first: the configured format,
+# then the remaining ones from smallest to largest output.
+ENCODERS = {
+    mimetype: encoder_for_mimetype(mimetype, OUTPUT_PRESET)
+    for mimetype in dict.fromkeys([
+        meme.encoder.mimetype, 'image/webp', 'image/jpeg', 'image/png'
+    ])
+    if mimetype in supported_mimetypes()
+}
+
+# Downloads for /create: size limit per image and an on-disk HTTP cache.
+FETCH_MAX_BYTES = int(os.environ.get('APP_FETCH_MAX_BYTES', 10 << 20))
+IMAGE_CACHE_DIR = os.environ.get('IMAGE_CACHE_DIR', './.image_cache')
+
+fetcher = ImageFetcher(
+    IMAGE_CACHE_DIR, max_bytes=FETCH_MAX_BYTES, cache_max_bytes=256 << 20,
+    metrics=registry
+)
+
+# Renders and /create downloads run on bounded pools.  Requests beyond
+# the running and queued limits are answered 503 at once, and a request
+# gives up (503) once its deadline in seconds has passed.
+RENDER_WORKERS = int(os.environ.get('APP_RENDER_WORKERS', 0)) or None
+RENDER_QUEUE = os.environ.get('APP_RENDER_QUEUE')
+RENDER_TIMEOUT = float(os.environ.get('APP_RENDER_TIMEOUT', 10))
+FETCH_WORKERS = int(os.environ.get('APP_FETCH_WORKERS', 8))
+FETCH_QUEUE = int(os.environ.get('APP_FETCH_QUEUE', 16))
+FETCH_TIMEOUT = float(os.environ.get('APP_FETCH_TIMEOUT', 20))
+
+renderer = RenderScheduler(
+    RENDER_WORKERS, int(RENDER_QUEUE) if RENDER_QUEUE else None,
+    timeout=RENDER_TIMEOUT, name='render', metrics=registry
+)
+downloader = RenderScheduler(
+    FETCH_WORKERS, FETCH_QUEUE, timeout=FETCH_TIMEOUT, name='fetch',
+    metrics=registry
+)
+
+QUOTE_CACHE_DIR = os.environ.get('QUOTE_CACHE_DIR', './.quote_cache')
+Ingestor.cache = QuoteCache(QUOTE_CACHE_DIR, metrics=registry)
+Ingestor.metrics = registry
+
+
+QUOTES_DIR = './_data/DogQuotes/'
+IMAGES_DIR = './_data/photos/dog/'
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+# Seconds between checks for changed quote files and photos (0 disables).
+WATCH_INTERVAL = float(os.environ.get('APP_WATCH_INTERVAL', '2'))
+
+# Widths accepted by the /meme/<image-id>/<quote-id> permalinks.
+MIN_WIDTH = 100
+MAX_WIDTH = int(os.environ.get('APP_MAX_WIDTH', 1000))
+
+# Permalinked memes never change, so caches may keep them for a year.
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+# Random memes kept pre-rendered for / (0 disables), and the number of
+# threads (or, with APP_POOL_PROCESSES=1, processes) rendering them.
+POOL_SIZE = int(os.environ.get('APP_POOL_SIZE', 16))
+POOL_WORKERS = int(os.environ.get('APP_POOL_WORKERS', 1))
+POOL_PROCESSES = os.environ.get('APP_POOL_PROCESSES') == '1'
+
+
+def is_image(path: str) -> bool:
+    """Return True if *path* looks like a supported photo."""
+    return path.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def image_id(path: str) -> str:
+    """Return the permalink id of the photo at *path*.
+
+    The id covers the path, modification time and size, so an edited
+    photo gets a new id and old permalinks never show different pixels.
+
+    :param path: Path to the photo.
+    :return: 16 hex digits.
+    :raises OSError: If the file cannot be stat'ed.
+    """
+    st = os.stat(path)
+    key = f'{path}\0{st.st_mtime_ns}\0{st.st_size}'.encode('utf-8')
+    return hashlib.blake2b(key, digest_size=8).hexdigest()
+
+
+def index_images(imgs: Iterable[str]) -> Dict[str, str]:
+    """Map permalink ids to photo paths, skipping vanished files."""
+    ids = {}
+    for path in imgs:
+        try:
+            ids[image_id(path)] = path
+        except OSError:
+            logger.warning("Cannot stat image %s", path)
+    return ids
 
 
 def setup():
     """Load all resources."""
-    quote_files = [
-        './_data/DogQuotes/DogQuotesTXT.txt',
-        './_data/DogQuotes/DogQuotesDOCX.docx',
-        './_data/DogQuotes/DogQuotesPDF.pdf',
-        './_data/DogQuotes/DogQuotesCSV.csv',
-    ]
-
-    quotes = []
-    for f in quote_files:
-        try:
-            quotes.extend(Ingestor.parse(f))
-        except QuoteEngineError as exc:
-            logger.warning("Could not parse '%s': %s", f, exc)
+    # Runs on a background thread of the server, so parse on threads
+    # rather than starting worker processes from it
+    quotes = QuoteLibrary.from_corpora(
+        CorpusLoader(use_processes=False).load_segments(QUOTES_DIR)
+    )
 
-    images_path = './_data/photos/dog/'
     imgs = []
-    for root, dirs, files in os.walk(images_path):
+    for root, dirs, files in os.walk(IMAGES_DIR):
         imgs.extend(
             os.path.join(root, name)
             for name in files
-            if name.lower().endswith(('.jpg', '.jpeg', '.png'))
+            if is_image(name)
         )
 
     return quotes, imgs
 
 
-quotes, imgs = setup()
+class Resources(NamedTuple):
+    """Everything the random-meme route needs, swapped in as one unit."""
+
+    quotes: QuoteLibrary
+    imgs: Tuple[str, ...]
+    image_ids: Dict[str, str]
+
+
+resources: Optional[Resources] = None
+ready = threading.Event()
+
+watcher: Optional[SourceWatcher] = None
+_watcher_pid: Optional[int] = None
+_reload_lock = threading.Lock()
+
+
+def load_resources() -> None:
+    """Load quotes and images and publish them for request handlers."""
+    global resources, watcher
+    try:
+        # Snapshot before loading so edits made meanwhile are not missed
+        if WATCH_INTERVAL > 0:
+            watcher = SourceWatcher(
+                [QUOTES_DIR, IMAGES_DIR],
+                accept=lambda p: Ingestor.can_ingest(p) or is_image(p)
+            )
+        quotes, imgs = setup()
+        resources = Resources(quotes, tuple(imgs), index_images(imgs))
+    except Exception:
+        logger.exception("Failed to load resources")
+        return
+    ready.set()
+    logger.info(
+        "Ready: %d quotes, %d images", len(quotes), len(imgs)
+    )
+
+
+def ensure_watching() -> None:
+    """Start the hot-reload watcher in this process if not running.
+
+    Threads do not survive ``fork``, so a pre-forked worker starts its
+    own watcher on its first request.
+    """
+    global _watcher_pid
+    if watcher is None or _watcher_pid == os.getpid():
+        return
+    with _reload_lock:
+        if _watcher_pid != os.getpid():
+            _watcher_pid = os.getpid()
+            watcher.start(apply_changes, WATCH_INTERVAL)
+
+
+def apply_changes(changes: Changes) -> None:
+    """Re-parse changed sources and publish updated resources.
+
+    Only files that were added, modified or removed are touched; the
+    new resources are swapped in with a single assignment, so in-flight
+    requests keep using the previous consistent set.
+
+    :param changes: Result of ``SourceWatcher.poll``.
+    """
+    global resources
+    with _reload_lock:
+        if resources is None:
+            return
+        quotes, imgs = resources.quotes, list(resources.imgs)
+        touched = set()
+
+        for path in changes.removed:
+            if is_image(path):
+                touched.add(path)
+                if path in imgs:
+                    imgs.remove(path)
+            else:
+                quotes = quotes.without_source(path)
+            logger.info("Removed %s", path)
+
+        for path in changes.added + changes.modified:
+            if is_image(path):
+                touched.add(path)
+                if path not in imgs:
+                    imgs.append(path)
+            else:
+                try:
+                    corpus = QuoteCorpus(Ingestor.iter_parse(path))
+                except QuoteEngineError as exc:
+                    logger.warning("Could not parse '%s': %s", path, exc)
+                    continue
+                quotes = quotes.with_source(path, corpus)
+            logger.info("Reloaded %s", path)
+
+        image_ids = resources.image_ids
+        if touched:
+            # Re-stat only the photos that changed; the rest keep their ids
+            image_ids = {
+                img_id: path for img_id, path in image_ids.items()
+                if path not in touched
+            }
+            image_ids.update(index_images(p for p in touched if p in imgs))
+        resources = Resources(quotes, tuple(imgs), image_ids)
+
+
+def random_job() -> Optional[MemeJob]:
+    """Pick an unfiltered random image and quote for the meme pool.
+
+    :return: A job, or None until resources have loaded.
+    """
+    res = resources
+    if res is None or not res.imgs:
+        return None
+    quote = res.quotes.random_choice()
+    if quote is None:
+        return None
+    return MemeJob(random.choice(res.imgs), quote.body, quote.author)
+
+
+pool: Optional[MemePool] = None
+if POOL_SIZE > 0:
+    pool = MemePool(
+        meme, random_job, size=POOL_SIZE, workers=POOL_WORKERS,
+        processes=POOL_PROCESSES, metrics=registry
+    )
+
+
+if os.environ.get('APP_PRELOAD') == '1':
+    # Pre-fork servers (e.g. ``gunicorn --preload``) load once in the
+    # master; freezing the heap keeps the data shared copy-on-write.
+    load_resources()
+    gc.freeze()
+else:
+    def _load_and_watch() -> None:
+        load_resources()
+        ensure_watching()
+        if pool is not None:
+            pool.start()
+
+    threading.Thread(
+        target=_load_and_watch, name='load-resources', daemon=True
+    ).start()
+
+
+if registry is not None:
+    @app.before_request
+    def start_request_timer() -> None:
+        """Note when the current request started."""
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def record_request(response: Response) -> Response:
+        """Record the current request's duration and status."""
+        endpoint = request.endpoint or 'unmatched'
+        registry.observe(
+            'http_request_seconds',
+            time.perf_counter() - g.request_started, endpoint=endpoint
+        )
+        registry.inc(
+            'http_requests_total', endpoint=endpoint,
+            status=str(response.status_code)
+        )
+        return response
+
+
+@app.errorhandler(SchedulerError)
+def overloaded(exc: SchedulerError):
+    """Answer 503 when a render or download is rejected or too slow."""
+    logger.warning("Shedding request: %s", exc)
+    return Response(
+        'The server is busy, try again shortly.', 503,
+        {'Retry-After': '1'}
+    )
+
+
+@app.route('/healthz')
+def healthz():
+    """Liveness probe: the process is up and serving."""
+    return 'ok', 200
+
+
+@app.route('/readyz')
+def readyz():
+    """Readiness probe: quotes and images have been loaded."""
+    if not ready.is_set():
+        return 'loading', 503, {'Retry-After': '1'}
+    return 'ready', 200
+
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Expose this process's metrics in the Prometheus text format."""
+    if registry is None:
+        abort(404)
+    return Response(
+        registry.render(), mimetype='text/plain; version=0.0.4'
+    )
+
+
+def choose_encoder() -> OutputEncoder:
+    """Return the encoder to use for the current request.
+
+    With ``APP_NEGOTIATE_FORMAT=1`` this is the best format the client
+    accepts, otherwise (or if it accepts none) the configured one.
+
+    :return: An OutputEncoder.
+    """
+    if not NEGOTIATE_FORMAT:
+        return meme.encoder
+    best = request.accept_mimetypes.best_match(list(ENCODERS))
+    return ENCODERS[best] if best else meme.encoder
+
+
+def pick_random() -> Tuple[str, QuoteModel]:
+    """Pick a random image and quote for the current request.
+
+    The optional ``author`` and ``q`` (keywords) query parameters
+    restrict the quote to matching ones.  Until resources have loaded
+    this aborts immediately with 503 and a ``Retry-After`` header.
+
+    :return: ``(image path, quote)``.
+    """
+    res = resources
+    if res is None:
+        abort(Response(
+            'Memes are still loading, try again shortly.', 503,
+            {'Retry-After': '1'}
+        ))
+    ensure_watching()
+
+    img = random.choice(res.imgs)
+    quote = res.quotes.random_choice(
+        q=request.args.get('q'), author=request.args.get('author')
+    )
+    if quote is None:
+        abort(404, description='No quote matches the given filters.')
+    return img, quote
 
 
 @app.route('/')
 def meme_rand():
-    """Generate a random meme."""
-    img = random.choice(imgs)
-    quote = random.choice(quotes)
-    path = meme.make_meme(img, quote.body, quote.author)
+    """Generate a random meme (see ``pick_random`` for parameters).
+
+    Unfiltered requests in the default format are served from the
+    pre-rendered pool; the meme is rendered inline only when the pool
+    is disabled or empty.
+    """
+    encoder = choose_encoder()
+    path = None
+    if (pool is not None and encoder == meme.encoder
+            and not request.args.get('q')
+            and not request.args.get('author')):
+        pool.start()
+        path = pool.get()
+
+    if path is None:
+        img, quote = pick_random()
+        path = renderer.call(
+            meme.make_meme, img, quote.body, quote.author, encoder=encoder
+        )
     return render_template('meme.html', path=path)
 
 
+@app.route('/meme')
+def meme_rand_negotiated():
+    """Render a random meme and return it in a negotiated format.
+
+    Like ``/meme.png``, but the format follows ``APP_NEGOTIATE_FORMAT``
+    and the request's Accept header.
+    """
+    img, quote = pick_random()
+    encoder = choose_encoder()
+    data = renderer.call(
+        meme.render, img, quote.body, quote.author, encoder=encoder
+    )
+    return Response(data, mimetype=encoder.mimetype, headers={
+        'Cache-Control': 'no-store', 'Vary': 'Accept'
+    })
+
+
+@app.route('/meme/random')
+def meme_random_permalink():
+    """Redirect to the permalink of a random meme.
+
+    Accepts the parameters of ``/`` plus ``w`` (width), which is
+    passed on to the permalink.
+    """
+    img, quote = pick_random()
+    try:
+        img_id = image_id(img)
+    except OSError:
+        abort(404, description='The chosen image has gone away.')
+    location = url_for(
+        'meme_permalink', img_id=img_id, quote_id=quote.quote_id,
+        w=request.args.get('w')
+    )
+    response = redirect(location)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+@app.route('/meme/<img_id>/<quote_id>')
+def meme_permalink(img_id: str, quote_id: str):
+    """Serve the meme for one photo and quote, rendering it once.
+
+    The URL fully determines the image, so it is served with a strong
+    ETag (the render digest) and ``Cache-Control: immutable``.  A
+    matching ``If-None-Match`` is answered 304 without rendering or
+    reading the file; otherwise the content-addressed output is reused
+    if it exists, and rendered on the render pool if not.
+
+    The optional ``w`` query parameter sets the width (default 500).
+    """
+    res = resources
+    if res is None:
+        abort(Response(
+            'Memes are still loading, try again shortly.', 503,
+            {'Retry-After': '1'}
+        ))
+
+    width = request.args.get('w', '500')
+    if not width.isdecimal() or not MIN_WIDTH <= int(width) <= MAX_WIDTH:
+        abort(400, description=(
+            f'w must be a width from {MIN_WIDTH} to {MAX_WIDTH}.'
+        ))
+    width = int(width)
+
+    img = res.image_ids.get(img_id)
+    quote = res.quotes.find(quote_id)
+    if img is None or quote is None:
+        abort(404)
+    try:
+        etag = meme.render_id(img, quote.body, quote.author, width)
+    except MemeGenerationError:
+        abort(404)
+
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+    else:
+        path = renderer.call(
+            meme.make_meme, img, quote.body, quote.author, width,
+            deterministic=True
+        )
+        response = send_file(
+            os.path.abspath(path), mimetype=meme.encoder.mimetype, etag=etag,
+            max_age=IMMUTABLE_MAX_AGE
+        )
+    response.cache_control.public = True
+    response.cache_control.max_age = IMMUTABLE_MAX_AGE
+    response.cache_control.immutable = True
+    return response
+
+
+@app.route('/meme.png')
+def meme_rand_image():
+    """Render a random meme and return the PNG itself.
+
+    Accepts the same parameters as ``/``.  The image is encoded in
+    memory and sent in the response, with nothing written to disk.
+    """
+    img, quote = pick_random()
+    data = renderer.call(
+        meme.render, img, quote.body, quote.author,
+        encoder=ENCODERS['image/png']
+    )
+    return Response(data, mimetype='image/png', headers={
+        'Cache-Control': 'no-store'
+    })
+
+
 @app.route('/create', methods=['GET'])
 def meme_form():
     """User input for meme information."""
@@ -77,25 +574,19 @@ def meme_post():
     body = request.form.get('body', '')
     author = request.form.get('author', '')
 
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix='.jpg')
-    os.close(tmp_fd)
-
     try:
-        response = requests.get(image_url, timeout=15)
-        response.raise_for_status()
-        with open(tmp_path, 'wb') as f:
-            f.write(response.content)
-
-        path = meme.make_meme(tmp_path, body, author)
-    except requests.RequestException as exc:
+        data = downloader.call(fetcher.fetch, image_url)
+        path = renderer.call(
+            meme.make_meme, data, body, author, encoder=choose_encoder()
+        )
+    except SchedulerError:
+        raise  # Answered by ``overloaded``
+    except ImageFetchError as exc:
         logger.error("Failed to download image: %s", exc)
         return render_template('meme_form.html'), 400
     except MemeGenerationError as exc:
         logger.error("Meme generation failed: %s", exc)
         return render_template('meme_form.html'), 400
-    finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
 
     return render_template('meme.html', path=path)
 
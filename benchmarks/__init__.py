@@ -0,0 +1 @@
+"""Offline benchmarks for quote ingestion and meme rendering."""
@@ -0,0 +1,52 @@
+"""Run the benchmark suite: ``python -m benchmarks [options]``."""
+
+import argparse
+import json
+import os
+import sys
+
+from .suite import SCALES, compare, run
+
+
+def main() -> int:
+    """Parse arguments, run the suite and write the JSON report."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark quote ingestion and meme rendering.'
+    )
+    parser.add_argument('--scale', choices=sorted(SCALES), default='full',
+                        help='Workload size (default: full)')
+    parser.add_argument('--only', action='append', default=None,
+                        metavar='SUBSTRING',
+                        help='Only run cases whose name contains this '
+                             '(repeatable)')
+    parser.add_argument('--workdir', default='./.bench',
+                        help='Where synthetic inputs are generated and '
+                             'kept between runs (default: ./.bench)')
+    parser.add_argument('--output', default=None,
+                        help='Write the JSON report here instead of stdout')
+    parser.add_argument('--compare', default=None, metavar='REPORT',
+                        help='Print p50 ratios against an earlier report')
+    args = parser.parse_args()
+
+    report = run(
+        os.path.abspath(args.workdir), args.scale, args.only,
+        progress=lambda msg: print(msg, file=sys.stderr, flush=True)
+    )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            base = json.load(f)
+        for line in compare(base, report):
+            print(line, file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""Write synthetic quote files and source images for benchmarking.
+
+Every generator is seeded, so the same arguments always produce the
+same bytes and results stay comparable across commits.
+"""
+
+import csv
+import random
+import zipfile
+from typing import Iterator, List, Tuple
+from xml.sax.saxutils import escape
+
+from PIL import Image, ImageDraw
+
+_WORDS = (
+    'bark bone chase dog fetch fur growl happy howl leash loyal nap paw '
+    'play pup run sit sniff squirrel stick tail treat walk wag woof yard '
+    'ball good boy girl friend home sleep dream sun grass park bath mud'
+).split()
+
+_AUTHORS = [
+    'Rex', 'Fido', 'Buddy', 'Max', 'Bella', 'Luna', 'Charlie', 'Daisy',
+    'Rocky', 'Molly', 'Bailey', 'Lucy', 'Cooper', 'Sadie', 'Duke', 'Maggie',
+]
+
+
+def quotes(count: int, seed: int = 0) -> Iterator[Tuple[str, str]]:
+    """Yield *count* random ``(body, author)`` pairs.
+
+    :param count: Number of quotes.
+    :param seed: Random seed.
+    :return: Iterator of body/author pairs.
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        body = ' '.join(rng.choices(_WORDS, k=rng.randint(4, 14)))
+        yield body.capitalize(), rng.choice(_AUTHORS)
+
+
+def write_txt(path: str, count: int, seed: int = 0) -> None:
+    """Write ``"body" - author`` lines.
+
+    :param path: Output file.
+    :param count: Number of quotes.
+    :param seed: Random seed.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        for body, author in quotes(count, seed):
+            f.write(f'"{body}" - {author}\n')
+
+
+def write_csv(path: str, count: int, seed: int = 0) -> None:
+    """Write a body,author CSV file.
+
+    :param path: Output file.
+    :param count: Number of quotes.
+    :param seed: Random seed.
+    """
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['body', 'author'])
+        writer.writerows(quotes(count, seed))
+
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'content-types">'
+    '<Default Extension="rels" ContentType="application/'
+    'vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+
+def write_docx(path: str, count: int, seed: int = 0) -> None:
+    """Write a minimal DOCX with one ``"body" - author`` paragraph each.
+
+    :param path: Output file.
+    :param count: Number of quotes.
+    :param seed: Random seed.
+    """
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', _DOCX_CONTENT_TYPES)
+        zf.writestr('_rels/.rels', _DOCX_RELS)
+        with zf.open('word/document.xml', 'w') as f:
+            f.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<w:document xmlns:w="http://schemas.openxmlformats.org/'
+                b'wordprocessingml/2006/main"><w:body>'
+            )
+            for body, author in quotes(count, seed):
+                text = escape(f'"{body}" - {author}')
+                f.write(
+                    f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>'
+                    .encode('utf-8')
+                )
+            f.write(b'</w:body></w:document>')
+
+
+def write_pdf(
+    path: str, count: int, seed: int = 0, lines_per_page: int = 50
+) -> None:
+    """Write a text-only PDF with one quote per line.
+
+    :param path: Output file.
+    :param count: Number of quotes.
+    :param seed: Random seed.
+    :param lines_per_page: Quotes per page.
+    """
+    lines = [f'"{body}" - {author}' for body, author in quotes(count, seed)]
+    pages = [
+        lines[i:i + lines_per_page]
+        for i in range(0, len(lines), lines_per_page)
+    ] or [[]]
+
+    # Objects 1-3 are fixed; each page adds a page and a content object
+    objects: List[bytes] = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'',
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    kids = []
+    for page in pages:
+        ops = ['BT /F1 9 Tf 11 TL 36 806 Td']
+        for line in page:
+            text = (
+                line.replace('\\', '\\\\')
+                .replace('(', '\\(').replace(')', '\\)')
+            )
+            ops.append(f'({text}) Tj T*')
+        ops.append('ET')
+        stream = '\n'.join(ops).encode('latin-1', 'replace')
+        objects.append(
+            b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream)
+        )
+        content_id = len(objects)
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+            b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>'
+            % content_id
+        )
+        kids.append(b'%d 0 R' % len(objects))
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+        b' '.join(kids), len(kids)
+    )
+
+    with open(path, 'wb') as f:
+        f.write(b'%PDF-1.4\n')
+        offsets = []
+        for number, obj in enumerate(objects, 1):
+            offsets.append(f.tell())
+            f.write(b'%d 0 obj\n%s\nendobj\n' % (number, obj))
+        xref = f.tell()
+        f.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+        for offset in offsets:
+            f.write(b'%010d 00000 n \n' % offset)
+        f.write(
+            b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+            % (len(objects) + 1, xref)
+        )
+
+
+def write_image(
+    path: str, size: Tuple[int, int] = (4032, 3024), seed: int = 0
+) -> None:
+    """Write a photo-like test image (format chosen by extension).
+
+    Smooth gradients with random shapes compress like a photograph
+    rather than like noise or flat colour.
+
+    :param path: Output file (``.jpg`` or ``.png``).
+    :param size: Width and height in pixels.
+    :param seed: Random seed.
+    """
+    rng = random.Random(seed)
+    width, height = size
+    img = Image.linear_gradient('L').resize(size).convert('RGB')
+    img = Image.merge('RGB', (
+        img.getchannel(0),
+        img.getchannel(1).rotate(90, expand=False).resize(size),
+        Image.radial_gradient('L').resize(size),
+    ))
+    draw = ImageDraw.Draw(img)
+    for _ in range(200):
+        x, y = rng.randrange(width), rng.randrange(height)
+        r = rng.randint(10, max(width, height) // 8)
+        colour = tuple(rng.randrange(256) for _ in range(3))
+        draw.ellipse((x - r, y - r, x + r, y + r), fill=colour)
+
+    if path.lower().endswith(('.jpg', '.jpeg')):
+        img.save(path, quality=90)
+    else:
+        img.save(path)
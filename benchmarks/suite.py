@@ -0,0 +1,389 @@
+"""Benchmark cases and the runner that times them.
+
+Each case runs in a fresh process so peak memory is attributable to
+that case alone.  A case is a setup function that receives the
+workspace directory and returns a zero-argument callable; every call
+performs one iteration and returns the number of items it processed
+(quotes parsed, searches run, images rendered).
+"""
+
+import math
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from multiprocessing import get_context
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from . import corpus
+
+# Bump when ``prepare`` starts generating different inputs.
+_INPUTS_VERSION = 2
+
+# Searches per iteration of a search case; one alone is too quick to time.
+_SEARCHES = 100
+
+# Caption used by the rendering cases.
+_TEXT = 'Every dog has its day, and today is definitely mine'
+_AUTHOR = 'Rex'
+
+
+class Scale(NamedTuple):
+    """Workload size for one run of the suite."""
+
+    quotes: int
+    ingest_iterations: int
+    render_iterations: int
+
+
+SCALES = {
+    'full': Scale(quotes=200_000, ingest_iterations=5, render_iterations=30),
+    'quick': Scale(quotes=20_000, ingest_iterations=3, render_iterations=10),
+}
+
+
+class Case(NamedTuple):
+    """A named benchmark."""
+
+    name: str
+    setup: Callable[[str], Callable[[], int]]
+    unit: str
+    render: bool = False
+    requires: Optional[str] = None
+
+
+# ---------------------------------------------------------------------------
+# Workspace — synthetic inputs, generated once per scale and reused
+# ---------------------------------------------------------------------------
+
+def prepare(workdir: str, scale: Scale) -> str:
+    """Generate the synthetic corpus and images if not present.
+
+    :param workdir: Parent directory for generated inputs.
+    :param scale: Workload size.
+    :return: Directory holding the inputs for *scale*.
+    """
+    root = os.path.join(
+        workdir, f'inputs-v{_INPUTS_VERSION}-{scale.quotes}'
+    )
+    marker = os.path.join(root, '.complete')
+    if os.path.exists(marker):
+        return root
+
+    os.makedirs(root, exist_ok=True)
+    corpus.write_txt(os.path.join(root, 'quotes.txt'), scale.quotes)
+    corpus.write_csv(os.path.join(root, 'quotes.csv'), scale.quotes)
+    corpus.write_docx(os.path.join(root, 'quotes.docx'), scale.quotes)
+    corpus.write_pdf(os.path.join(root, 'quotes.pdf'), scale.quotes)
+    corpus.write_image(os.path.join(root, 'photo.jpg'), (4032, 3024))
+    corpus.write_image(os.path.join(root, 'photo.png'), (3000, 2000))
+    corpus.write_image(os.path.join(root, 'small.jpg'), (640, 480))
+    open(marker, 'w').close()
+    return root
+
+
+def _scratch(root: str, name: str) -> str:
+    """Return an empty scratch directory next to the inputs.
+
+    :param root: Workspace directory.
+    :param name: Scratch directory name.
+    :return: Its path.
+    """
+    path = os.path.join(os.path.dirname(root), 'scratch', name)
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Ingestion cases
+# ---------------------------------------------------------------------------
+
+def _ingest(filename: str, ingestor: Optional[str] = None,
+            **attrs) -> Callable:
+    """Build a setup function that parses *filename*.
+
+    :param filename: Input file in the workspace.
+    :param ingestor: Class name in ``QuoteEngine`` to parse with
+        directly; by default ``Ingestor`` picks one by extension.
+    :param attrs: Class attributes to set first (e.g. ``backend``).
+    :return: Setup function.
+    """
+    def setup(root: str) -> Callable[[], int]:
+        if ingestor is None:
+            from QuoteEngine import Ingestor as parser
+        else:
+            module = import_module(f'QuoteEngine.{ingestor}')
+            parser = getattr(module, ingestor)
+        for key, value in attrs.items():
+            setattr(parser, key, value)
+        path = os.path.join(root, filename)
+        return lambda: len(parser.parse(path))
+    return setup
+
+
+def _setup_cache_hit(root: str) -> Callable[[], int]:
+    """Time ``Ingestor.parse`` of the DOCX file from a warm QuoteCache.
+
+    DOCX is the costliest format to parse, so this is where the cache
+    has to pay off; compare with ``ingest.docx``.
+    """
+    from QuoteEngine import Ingestor, QuoteCache
+    Ingestor.cache = QuoteCache(_scratch(root, 'quote-cache'))
+    path = os.path.join(root, 'quotes.docx')
+    Ingestor.parse(path)
+    return lambda: len(Ingestor.parse(path))
+
+
+def _setup_search(q: Optional[str], author: Optional[str]) -> Callable:
+    """Time ``QuoteIndex.search`` over the whole TXT corpus."""
+    def setup(root: str) -> Callable[[], int]:
+        from QuoteEngine import Ingestor, QuoteCorpus, QuoteIndex
+        quotes = Ingestor.parse(os.path.join(root, 'quotes.txt'))
+        index = QuoteIndex(QuoteCorpus(quotes))
+
+        def run() -> int:
+            for _ in range(_SEARCHES):
+                index.search(q=q, author=author)
+            return _SEARCHES
+        return run
+    return setup
+
+
+# ---------------------------------------------------------------------------
+# Rendering cases — MemeEngine.make_meme end to end
+# ---------------------------------------------------------------------------
+
+def _setup_make_meme(filename: str, repeat: bool = False) -> Callable:
+    """Time ``make_meme``, writing into a scratch output directory.
+
+    Each call captions the image with a new text unless *repeat* is
+    set, so every call really renders; with *repeat* the inputs never
+    change and whatever reuse the engine offers is measured.
+    """
+    def setup(root: str) -> Callable[[], int]:
+        from MemeEngine import MemeEngine
+        name = filename.replace('.', '-') + ('-repeat' if repeat else '')
+        engine = MemeEngine(_scratch(root, f'memes-{name}'))
+        path = os.path.join(root, filename)
+        counter = iter(range(sys.maxsize))
+
+        def run() -> int:
+            text = _TEXT if repeat else f'{_TEXT} #{next(counter)}'
+            engine.make_meme(path, text, _AUTHOR)
+            return 1
+        return run
+    return setup
+
+
+# Cases only use public APIs that have existed since the first commit
+# (``Ingestor.parse``, ``MemeEngine.make_meme``), or declare the newer
+# ones they need in ``requires``, so the suite runs unchanged against
+# any commit and its numbers can be compared.
+CASES: List[Case] = [
+    Case('ingest.txt', _ingest('quotes.txt'), 'quotes'),
+    Case('ingest.csv', _ingest('quotes.csv'), 'quotes',
+         requires='pandas'),
+    Case('ingest.csv.stdlib', _ingest(
+        'quotes.csv', 'CSVIngestor', backend='csv'
+    ), 'quotes', requires='QuoteEngine.CSVIngestor:CSVIngestor.backend'),
+    Case('ingest.docx', _ingest('quotes.docx'), 'quotes'),
+    Case('ingest.pdf', _ingest('quotes.pdf'), 'quotes',
+         requires='pdftotext'),
+    Case('ingest.cache_hit.docx', _setup_cache_hit, 'quotes',
+         requires='QuoteEngine:QuoteCache'),
+    Case('search.keywords', _setup_search('dog walk', None), 'queries',
+         requires='QuoteEngine:QuoteIndex'),
+    Case('search.author', _setup_search(None, 'Rex'), 'queries',
+         requires='QuoteEngine:QuoteIndex'),
+    Case('render.make_meme.jpeg', _setup_make_meme('photo.jpg'),
+         'images', True),
+    Case('render.make_meme.png', _setup_make_meme('photo.png'),
+         'images', True),
+    Case('render.make_meme.small', _setup_make_meme('small.jpg'),
+         'images', True),
+    Case('render.make_meme.repeat', _setup_make_meme('photo.jpg', True),
+         'images', True),
+]
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _maxrss_bytes() -> int:
+    """Return this process's peak resident set size in bytes."""
+    # Linux: VmHWM starts afresh at exec, unlike ru_maxrss which a
+    # spawned worker inherits from the parent process.
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, other platforms KiB
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of pre-sorted values."""
+    index = max(math.ceil(q * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+def _run_case(name: str, root: str, iterations: int) -> Dict:
+    """Run one case (inside a fresh worker process).
+
+    :param name: Name of the case in ``CASES``.
+    :param root: Workspace directory.
+    :param iterations: Timed iterations after one warm-up call.
+    :return: Result record.
+    """
+    import logging
+    logging.disable(logging.CRITICAL)
+    case = next(c for c in CASES if c.name == name)
+
+    rss_before = _maxrss_bytes()
+    fn = case.setup(root)
+    fn()
+
+    durations = []
+    items = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        items += fn()
+        durations.append(time.perf_counter() - start)
+
+    total = sum(durations)
+    durations.sort()
+    return {
+        'name': case.name,
+        'unit': case.unit,
+        'iterations': iterations,
+        'items': items,
+        'total_s': total,
+        'mean_s': total / iterations,
+        'p50_s': _percentile(durations, 0.50),
+        'p99_s': _percentile(durations, 0.99),
+        'min_s': durations[0],
+        'throughput_per_s': items / total if total else None,
+        'peak_rss_bytes': _maxrss_bytes(),
+        'setup_rss_bytes': rss_before,
+    }
+
+
+def _available(requirement: Optional[str]) -> bool:
+    """Return True if an optional dependency or API is present.
+
+    :param requirement: ``pdftotext``, a module name, or
+        ``module:attribute.path`` for an API the tree must provide.
+    """
+    if requirement is None:
+        return True
+    if requirement == 'pdftotext':
+        return shutil.which('pdftotext') is not None
+    module_name, _, attr_path = requirement.partition(':')
+    try:
+        obj = import_module(module_name)
+    except ImportError:
+        return False
+    for attr in filter(None, attr_path.split('.')):
+        if not hasattr(obj, attr):
+            return False
+        obj = getattr(obj, attr)
+    return True
+
+
+def _git_revision() -> Optional[str]:
+    """Return the current git commit, if any."""
+    try:
+        out = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+            timeout=5, check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run(
+    workdir: str, scale_name: str = 'full',
+    selected: Optional[List[str]] = None,
+    progress: Callable[[str], None] = lambda msg: None
+) -> Dict:
+    """Run the suite and return a JSON-serialisable report.
+
+    :param workdir: Directory for generated inputs (reused if present).
+    :param scale_name: Key of ``SCALES``.
+    :param selected: Only run cases whose name contains one of these.
+    :param progress: Called with a message before each case.
+    :return: Report with ``meta`` and ``results``.
+    """
+    from PIL import __version__ as pillow_version
+
+    scale = SCALES[scale_name]
+    progress(f'Preparing inputs in {workdir}')
+    root = prepare(workdir, scale)
+
+    results = []
+    skipped = []
+    spawn = get_context('spawn')
+    for case in CASES:
+        if selected and not any(s in case.name for s in selected):
+            continue
+        if not _available(case.requires):
+            skipped.append({'name': case.name, 'missing': case.requires})
+            continue
+        iterations = (
+            scale.render_iterations if case.render
+            else scale.ingest_iterations
+        )
+        progress(f'Running {case.name}')
+        with ProcessPoolExecutor(1, mp_context=spawn) as pool:
+            results.append(
+                pool.submit(_run_case, case.name, root, iterations).result()
+            )
+
+    shutil.rmtree(os.path.join(workdir, 'scratch'), ignore_errors=True)
+    return {
+        'meta': {
+            'git_revision': _git_revision(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'scale': scale_name,
+            'quotes': scale.quotes,
+            'python': platform.python_version(),
+            'pillow': pillow_version,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+        'skipped': skipped,
+    }
+
+
+def compare(base: Dict, current: Dict) -> List[str]:
+    """Format a p50 comparison of two reports.
+
+    :param base: Earlier report.
+    :param current: Newer report.
+    :return: Table lines; ratios below 1.0 mean *current* is faster.
+    """
+    before = {r['name']: r for r in base['results']}
+    lines = [f"{'case':<28}{'base p50':>12}{'p50':>12}{'ratio':>8}"]
+    for result in current['results']:
+        old = before.get(result['name'])
+        if old is None:
+            continue
+        ratio = result['p50_s'] / old['p50_s'] if old['p50_s'] else 0.0
+        lines.append(
+            f"{result['name']:<28}{old['p50_s'] * 1e3:>10.2f}ms"
+            f"{result['p50_s'] * 1e3:>10.2f}ms{ratio:>8.2f}"
+        )
+    return lines
@@ -1,12 +1,18 @@
 """CLI tool for generating memes with random or user-supplied quotes."""
 
 import argparse
+import csv
 import logging
 import os
 import random
+import sys
+from typing import Iterator, List, Optional
 
-from MemeEngine import MemeEngine
-from QuoteEngine import Ingestor, QuoteModel
+from MemeEngine import MemeEngine, MemeJob, MemeResult, OutputEncoder
+from MemeEngine.exceptions import MemeGenerationError
+from QuoteEngine import (
+    CorpusLoader, Ingestor, QuoteCache, QuoteCorpus, QuoteModel
+)
 from QuoteEngine.exceptions import QuoteEngineError
 
 logging.basicConfig(
@@ -15,52 +21,134 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+IMAGES_DIR = './_data/photos/dog/'
+QUOTE_FILES = [
+    './_data/DogQuotes/DogQuotesTXT.txt',
+    './_data/DogQuotes/DogQuotesDOCX.docx',
+    './_data/DogQuotes/DogQuotesPDF.pdf',
+    './_data/DogQuotes/DogQuotesCSV.csv',
+]
+OUTPUT_DIR = './tmp'
+
+QUOTE_CACHE_DIR = os.environ.get('QUOTE_CACHE_DIR', './.quote_cache')
+
+
+def load_images(images_dir: str = IMAGES_DIR) -> List[str]:
+    """Collect the paths of all images below *images_dir*.
+
+    :param images_dir: Directory to search recursively.
+    :return: List of image file paths.
+    """
+    imgs = []
+    for root, dirs, files in os.walk(images_dir):
+        imgs.extend(
+            os.path.join(root, name)
+            for name in files
+            if name.lower().endswith(('.jpg', '.jpeg', '.png'))
+        )
+    return imgs
+
 
-def generate_meme(path=None, body=None, author=None):
+def load_quotes(quote_files: List[str] = QUOTE_FILES) -> QuoteCorpus:
+    """Parse every quote file concurrently, skipping unreadable ones.
+
+    :param quote_files: Paths of quote files to parse.
+    :return: QuoteCorpus of all loaded quotes.
+    :raises QuoteEngineError: If no quotes could be loaded at all.
+    """
+    quotes = CorpusLoader().load(quote_files)
+    if not quotes:
+        raise QuoteEngineError("No quotes could be loaded from any file")
+    return quotes
+
+
+def generate_meme(path=None, body=None, author=None, output_format='png'):
     """Generate a meme given an image path and a quote.
 
     :param path: Path to a source image (random if None).
     :param body: Quote body text (random if None).
     :param author: Quote author (required when body is given).
+    :param output_format: Output ``"format[:preset]"`` spec.
     :return: File path of the generated meme.
     """
     if path is None:
-        images_dir = './_data/photos/dog/'
-        imgs = []
-        for root, dirs, files in os.walk(images_dir):
-            imgs.extend(
-                os.path.join(root, name)
-                for name in files
-                if name.lower().endswith(('.jpg', '.jpeg', '.png'))
-            )
-        img = random.choice(imgs)
+        img = random.choice(load_images())
     else:
         img = path
 
     if body is None:
-        quote_files = [
-            './_data/DogQuotes/DogQuotesTXT.txt',
-            './_data/DogQuotes/DogQuotesDOCX.docx',
-            './_data/DogQuotes/DogQuotesPDF.pdf',
-            './_data/DogQuotes/DogQuotesCSV.csv',
-        ]
-        quotes = []
-        for f in quote_files:
-            try:
-                quotes.extend(Ingestor.parse(f))
-            except QuoteEngineError as exc:
-                logger.warning("Could not parse '%s': %s", f, exc)
-        if not quotes:
-            raise QuoteEngineError("No quotes could be loaded from any file")
-        quote = random.choice(quotes)
+        quote = load_quotes().random_choice()
     else:
         quote = QuoteModel(body, author)
 
-    meme = MemeEngine('./tmp')
+    meme = MemeEngine(OUTPUT_DIR, encoder=output_format)
     out = meme.make_meme(img, quote.body, quote.author)
     return out
 
 
+def read_manifest(manifest: str) -> Iterator[dict]:
+    """Yield rows from a CSV manifest with path, body and author columns.
+
+    Blank cells mean "pick at random".
+
+    :param manifest: Path to the manifest CSV file.
+    :return: Iterator of row dicts.
+    """
+    with open(manifest, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            yield {
+                key: (row.get(key) or '').strip() or None
+                for key in ('path', 'body', 'author')
+            }
+
+
+def generate_memes(
+    count: Optional[int] = None, manifest: Optional[str] = None,
+    path=None, body=None, author=None, workers: Optional[int] = None,
+    output_format: str = 'png'
+) -> Iterator[MemeResult]:
+    """Generate many memes in parallel.
+
+    The image list and quote corpus are loaded once (and only if some
+    job needs a random pick); rendering runs on a process pool and
+    results are yielded as they finish.
+
+    :param count: Number of memes to generate from *path*, *body* and
+        *author*, picking the missing parts at random.
+    :param manifest: CSV manifest of path/body/author rows, used
+        instead of *count*.
+    :param path: Fixed image path for ``count`` mode.
+    :param body: Fixed quote body for ``count`` mode.
+    :param author: Fixed quote author for ``count`` mode.
+    :param workers: Number of worker processes (defaults to CPUs).
+    :param output_format: Output ``"format[:preset]"`` spec.
+    :return: Iterator of MemeResult in completion order.
+    """
+    if manifest is not None:
+        rows = list(read_manifest(manifest))
+    else:
+        rows = [{'path': path, 'body': body, 'author': author}] * count
+
+    imgs = None
+    if any(row['path'] is None for row in rows):
+        imgs = load_images()
+    quotes = None
+    if any(row['body'] is None for row in rows):
+        quotes = load_quotes()
+
+    def jobs():
+        for row in rows:
+            img = row['path'] or random.choice(imgs)
+            if row['body'] is None:
+                quote = quotes.random_choice()
+            else:
+                quote = QuoteModel(row['body'], row['author'] or '')
+            yield MemeJob(img, quote.body, quote.author)
+
+    meme = MemeEngine(OUTPUT_DIR, encoder=output_format)
+    return meme.make_memes(jobs(), workers=workers)
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Generate a meme image.')
     parser.add_argument('--path', type=str, default=None,
@@ -69,9 +157,48 @@ if __name__ == '__main__':
                         help='Quote body to add to the image')
     parser.add_argument('--author', type=str, default=None,
                         help='Quote author to add to the image')
+    batch = parser.add_mutually_exclusive_group()
+    batch.add_argument('--count', type=int, default=None,
+                       help='Generate this many memes in parallel')
+    batch.add_argument('--manifest', type=str, default=None,
+                       help='CSV file of path,body,author rows to render')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for batch mode '
+                             '(default: number of CPUs)')
+    parser.add_argument('--format', type=str, default='png',
+                        help='Output format and optional preset, e.g. '
+                             'png, jpeg:fast or webp:small')
     args = parser.parse_args()
 
     if args.body and not args.author:
         parser.error('--author is required when --body is provided')
+    if args.count is not None and args.count < 1:
+        parser.error('--count must be at least 1')
+    if args.manifest and (args.path or args.body or args.author):
+        parser.error('--manifest cannot be combined with '
+                     '--path, --body or --author')
+    if args.manifest and not os.path.isfile(args.manifest):
+        parser.error(f'--manifest file not found: {args.manifest}')
+    try:
+        OutputEncoder.from_spec(args.format)
+    except MemeGenerationError as exc:
+        parser.error(str(exc))
+
+    # Only the CLI opts in to the on-disk quote cache; importing this
+    # module must not change how Ingestor behaves for the importer
+    Ingestor.cache = QuoteCache(QUOTE_CACHE_DIR)
+
+    if args.count is None and args.manifest is None:
+        print(generate_meme(args.path, args.body, args.author,
+                            args.format))
+        sys.exit(0)
 
-    print(generate_meme(args.path, args.body, args.author))
+    failed = 0
+    for result in generate_memes(args.count, args.manifest, args.path,
+                                 args.body, args.author, args.workers,
+                                 args.format):
+        if result.ok:
+            print(result.path, flush=True)
+        else:
+            failed += 1
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,194 @@
+"""In-process metrics with Prometheus text exposition.
+
+``QuoteEngine`` and ``MemeEngine`` accept any object with the two
+methods below as their ``metrics`` hook, so another backend can be
+plugged in without changing them::
+
+    metrics.timer(name, **labels)    # context manager timing a block
+    metrics.inc(name, amount=1, **labels)
+
+When the hook is ``None`` (the default) instrumented code skips all
+of it, so disabled metrics cost one attribute check per stage.
+"""
+
+import bisect
+import math
+import threading
+import time
+from typing import Dict, List, Sequence, Tuple
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+# Latency buckets in seconds, from 100µs to 10s.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class _Histogram:
+    """Cumulative-bucket histogram of observed values."""
+
+    __slots__ = ('counts', 'count', 'sum')
+
+    def __init__(self, size: int) -> None:
+        """Create an empty histogram with *size* finite buckets."""
+        self.counts = [0] * (size + 1)
+        self.count = 0
+        self.sum = 0.0
+
+
+class _Timer:
+    """Context manager that records the duration of its block."""
+
+    __slots__ = ('_registry', '_name', '_labels', '_start')
+
+    def __init__(
+        self, registry: 'MetricsRegistry', name: str, labels: _LabelKey
+    ) -> None:
+        self._registry = registry
+        self._name = name
+        self._labels = labels
+
+    def __enter__(self) -> '_Timer':
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._registry._observe(
+            self._name, self._labels, time.perf_counter() - self._start
+        )
+
+
+class MetricsRegistry:
+    """Thread-safe counters and latency histograms.
+
+    Metric names and help texts may be declared up front with
+    ``describe``; undeclared names are created on first use.  Each
+    process keeps its own registry, so with several worker processes
+    every worker exposes its own numbers.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Create an empty registry.
+
+        :param buckets: Upper bounds of the histogram buckets.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[_LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[_LabelKey, _Histogram]] = {}
+        self._help: Dict[str, str] = {}
+
+    def describe(self, name: str, help_text: str) -> None:
+        """Set the ``# HELP`` text for *name*.
+
+        :param name: Metric name.
+        :param help_text: One-line description.
+        """
+        self._help[name] = help_text
+
+    def timer(self, name: str, **labels: str) -> _Timer:
+        """Return a context manager that observes its duration.
+
+        :param name: Histogram name (seconds).
+        :param labels: Label values.
+        :return: A reusable-once timer.
+        """
+        return _Timer(self, name, tuple(sorted(labels.items())))
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Add *value* to the histogram *name*.
+
+        :param name: Histogram name.
+        :param value: Observed value.
+        :param labels: Label values.
+        """
+        self._observe(name, tuple(sorted(labels.items())), value)
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        """Increase the counter *name* by *amount*.
+
+        :param name: Counter name (conventionally ending ``_total``).
+        :param amount: Non-negative increment.
+        :param labels: Label values.
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text format (0.0.4).
+
+        :return: Exposition text.
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                self._header(lines, name, 'counter')
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f'{name}{_labels(key)} {_number(value)}')
+
+            for name in sorted(self._histograms):
+                self._header(lines, name, 'histogram')
+                for key, hist in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    bounds = (*self.buckets, math.inf)
+                    for bound, count in zip(bounds, hist.counts):
+                        cumulative += count
+                        le = (('le', _number(bound)),)
+                        lines.append(
+                            f'{name}_bucket{_labels(key + le)} {cumulative}'
+                        )
+                    lines.append(
+                        f'{name}_sum{_labels(key)} {_number(hist.sum)}'
+                    )
+                    lines.append(f'{name}_count{_labels(key)} {hist.count}')
+        return '\n'.join(lines) + '\n'
+
+    # -------------------------------------------------------------------
+    # Private helpers
+    # -------------------------------------------------------------------
+
+    def _observe(self, name: str, key: _LabelKey, value: float) -> None:
+        """Record *value* in the histogram series *name*/*key*."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = _Histogram(len(self.buckets))
+            hist.counts[index] += 1
+            hist.count += 1
+            hist.sum += value
+
+    def _header(self, lines: List[str], name: str, kind: str) -> None:
+        """Append the HELP and TYPE lines for *name*."""
+        help_text = self._help.get(name)
+        if help_text:
+            lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+
+
+def _labels(key: _LabelKey) -> str:
+    """Format a label set as ``{a="1",b="2"}`` (empty for none)."""
+    if not key:
+        return ''
+    parts = (
+        '{}="{}"'.format(
+            k, str(v).replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n')
+        )
+        for k, v in key
+    )
+    return '{' + ','.join(parts) + '}'
+
+
+def _number(value: float) -> str:
+    """Format a sample value the way Prometheus expects."""
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
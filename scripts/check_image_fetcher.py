@@ -0,0 +1,157 @@
+"""Check ImageFetcher against a local stand-in HTTP server.
+
+Runs offline: ``python scripts/check_image_fetcher.py``.  Covers a
+first download, a 304 revalidation, the ``max_bytes`` cutoff (with and
+without ``Content-Length``) and falling back to the cached copy when
+the server is unreachable.  Exits non-zero on the first failed check.
+"""
+
+import contextlib
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__
+))))
+
+from MemeEngine import ImageFetcher  # noqa: E402
+from MemeEngine.exceptions import ImageFetchError  # noqa: E402
+
+_IMAGE = b'\x89PNG\r\n\x1a\n' + bytes(range(256)) * 64
+_ETAG = '"v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve ``/image`` with an ETag and ``/big`` with or without a length.
+
+    Every request's path and ``If-None-Match`` header are appended to
+    the server's ``seen`` list.
+    """
+
+    def do_GET(self) -> None:
+        self.server.seen.append(
+            (self.path, self.headers.get('If-None-Match'))
+        )
+        if self.path == '/image':
+            if self.headers.get('If-None-Match') == _ETAG:
+                self.send_response(304)
+                self.send_header('ETag', _ETAG)
+                self.end_headers()
+                return
+            self._send(_IMAGE, length=True)
+        elif self.path in ('/big', '/big-chunked'):
+            self._send(b'\0' * (1 << 20), length=self.path == '/big')
+        else:
+            self.send_error(404)
+
+    def _send(self, body: bytes, length: bool) -> None:
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('ETag', _ETAG)
+        if length:
+            self.send_header('Content-Length', str(len(body)))
+        else:
+            # No length: the body runs until the connection closes
+            self.close_connection = True
+        self.end_headers()
+        with contextlib.suppress(OSError):
+            self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _Outcomes:
+    """Metrics hook that records ``image_fetch_total`` outcomes."""
+
+    def __init__(self) -> None:
+        self.results: List[str] = []
+
+    def timer(self, name: str, **labels: str):
+        return contextlib.nullcontext()
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        if name == 'image_fetch_total':
+            self.results.append(labels['result'])
+
+
+def _check(condition: bool, message: str) -> None:
+    """Print *message* as passed, or fail with it."""
+    if not condition:
+        raise AssertionError(message)
+    print(f'ok  {message}')
+
+
+def main() -> int:
+    """Run every check; return the process exit status."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.seen = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+    outcomes = _Outcomes()
+    seen: List = server.seen
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        fetcher = ImageFetcher(
+            cache_dir, max_bytes=64 * 1024, timeout=5, metrics=outcomes
+        )
+        try:
+            data = fetcher.fetch(base + '/image')
+            _check(
+                data == _IMAGE and outcomes.results[-1] == 'downloaded'
+                and seen[-1] == ('/image', None),
+                'first fetch downloads the image'
+            )
+
+            data = fetcher.fetch(base + '/image')
+            _check(
+                data == _IMAGE and outcomes.results[-1] == 'revalidated'
+                and seen[-1] == ('/image', _ETAG),
+                'second fetch revalidates with If-None-Match and gets 304'
+            )
+
+            cutoffs: Dict[str, str] = {}
+            for path in ('/big', '/big-chunked'):
+                try:
+                    fetcher.fetch(base + path)
+                except ImageFetchError as exc:
+                    cutoffs[path] = str(exc)
+            _check(
+                len(cutoffs) == 2
+                and all('larger than' in e for e in cutoffs.values()),
+                'bodies over max_bytes are rejected, with or without '
+                'Content-Length'
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        data = fetcher.fetch(base + '/image')
+        _check(
+            data == _IMAGE and outcomes.results[-1] == 'stale',
+            'cached copy is served when the server is unreachable'
+        )
+
+        try:
+            fetcher.fetch(base + '/never-cached')
+        except ImageFetchError:
+            failed = True
+        else:
+            failed = False
+        _check(
+            failed and outcomes.results[-1] == 'error',
+            'uncached URL fails when the server is unreachable'
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except AssertionError as exc:
+        print(f'FAIL  {exc}', file=sys.stderr)
+        sys.exit(1)